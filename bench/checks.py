@@ -0,0 +1,144 @@
+# Checks the days' indexes and other non-obvious algorithms against brute-force scans on many small random inputs, so
+# an optimisation that changes an answer fails loudly rather than just showing up as a faster time
+# Usage (from the repository root): python -m bench.checks [day_04 ...] [--seed 0] [--trials 200]
+# The regression gate (bench.regression) runs these checks before measuring anything
+
+import argparse
+import random
+import sys
+
+from common.days import load_day
+
+
+def check_section_index(day, rng, max_section_id=30):
+    # Returns the mismatches found, e.g. ['count_covering(5): 3 != 2']
+    assignments = []
+    for _ in range(rng.randint(0, 20)):
+        start_id = rng.randint(1, max_section_id)
+        assignments.append(day.Assignment(start_id, rng.randint(start_id, max_section_id)))
+    section_index = day.SectionIndex(assignments)
+
+    def is_overlapping(assignment, start_id, end_id):
+        return assignment.start_id <= end_id and start_id <= assignment.end_id
+
+    mismatches = []
+    for section_id in range(max_section_id + 2):
+        expected = sum(is_overlapping(assignment, section_id, section_id) for assignment in assignments)
+        if (count := section_index.count_covering(section_id)) != expected:
+            mismatches.append(f'count_covering({section_id}): {count} != {expected}')
+    for _ in range(10):
+        start_id = rng.randint(0, max_section_id + 1)
+        end_id = rng.randint(start_id, max_section_id + 1)
+        expected = [assignment for assignment in section_index.assignments if
+                    is_overlapping(assignment, start_id, end_id)]
+        if (count := section_index.count_overlapping(start_id, end_id)) != len(expected):
+            mismatches.append(f'count_overlapping({start_id}, {end_id}): {count} != {len(expected)}')
+        if (overlapping := section_index.find_overlapping(start_id, end_id)) != expected:
+            mismatches.append(f'find_overlapping({start_id}, {end_id}): {overlapping} != {expected}')
+    expected = {}
+    if assignments:
+        first_id = min(assignment.start_id for assignment in assignments)
+        last_id = max(assignment.end_id for assignment in assignments)
+        expected = {section_id: sum(is_overlapping(assignment, section_id, section_id) for assignment in assignments)
+                    for section_id in range(first_id, last_id + 1)}
+    if (coverage := section_index.get_coverage()) != expected:
+        mismatches.append(f'get_coverage(): {coverage} != {expected}')
+    return mismatches
+
+
+def check_size_index(day, rng, max_size=100):
+    # Returns the mismatches found, e.g. ['sum_at_most(50): 120 != 95']
+    sizes = [rng.randint(0, max_size) for _ in range(rng.randint(0, 20))]
+    size_index = day.SizeIndex(sizes)
+    mismatches = []
+    if len(size_index) != len(sizes):
+        mismatches.append(f'len(): {len(size_index)} != {len(sizes)}')
+    for size in range(-1, max_size + 2):
+        expected = sum(1 for other_size in sizes if other_size <= size)
+        if (count := size_index.count_at_most(size)) != expected:
+            mismatches.append(f'count_at_most({size}): {count} != {expected}')
+        expected = sum(other_size for other_size in sizes if other_size <= size)
+        if (total_size := size_index.sum_at_most(size)) != expected:
+            mismatches.append(f'sum_at_most({size}): {total_size} != {expected}')
+        expected = min((other_size for other_size in sizes if other_size >= size), default=None)
+        if (smallest_size := size_index.find_smallest_at_least(size)) != expected:
+            mismatches.append(f'find_smallest_at_least({size}): {smallest_size} != {expected}')
+    return mismatches
+
+
+def get_viewing_distance(heights, i):
+    # How many trees the tree at i sees towards the end of its line, up to and including the first one at least as tall
+    for j in range(i + 1, len(heights)):
+        if heights[j] >= heights[i]:
+            return j - i
+    return len(heights) - 1 - i
+
+
+def check_viewing_distances(day, rng):
+    # Returns the mismatches found, e.g. ['get_viewing_distances([3, 0, 3]): [1, 1, 0] != [2, 1, 0]']
+    heights = [rng.randint(0, 9) for _ in range(rng.randint(0, 12))]
+    expected = [get_viewing_distance(heights, i) for i in range(len(heights))]
+    if (viewing_distances := day.Forest.get_viewing_distances(heights)) != expected:
+        return [f'get_viewing_distances({heights}): {viewing_distances} != {expected}']
+    return []
+
+
+def check_forest_array(day, rng):
+    # Returns the mismatches found, comparing ForestArray tree by tree with Forest (itself checked by
+    # check_viewing_distances()), and its vectorised viewing distances with brute force
+    height_rows = [''.join(rng.choices('0123456789', k=rng.randint(1, 8)))]
+    height_rows.extend(''.join(rng.choices('0123456789', k=len(height_rows[0]))) for _ in range(rng.randint(0, 7)))
+    height_map = '\n'.join(height_rows)
+    forest = day.Forest.from_height_map(height_map)
+    forest_array = day.ForestArray.from_height_map_bytes(height_map.encode())
+    mismatches = []
+    line_heights = forest_array.heights.astype(int).tolist()
+    expected = [[get_viewing_distance(heights, i) for i in range(len(heights))] for heights in line_heights]
+    if (viewing_distances := day.ForestArray.get_viewing_distances(forest_array.heights).tolist()) != expected:
+        mismatches.append(f'get_viewing_distances({line_heights}): {viewing_distances} != {expected}')
+    expected = [[tree.is_visible for tree in tree_row] for tree_row in forest.trees]
+    if (is_visible := forest_array.is_visible.tolist()) != expected:
+        mismatches.append(f'is_visible for {height_rows}: {is_visible} != {expected}')
+    expected = [[tree.scenic_score for tree in tree_row] for tree_row in forest.trees]
+    if (scenic_scores := forest_array.scenic_scores.tolist()) != expected:
+        mismatches.append(f'scenic_scores for {height_rows}: {scenic_scores} != {expected}')
+    return mismatches
+
+
+CHECKS = {
+    'day_04': (check_section_index,),
+    'day_07': (check_size_index,),
+    'day_08': (check_viewing_distances, check_forest_array),
+}
+
+
+def run_checks(day_names, seed=0, trials=200):
+    # Returns the mismatches found, each prefixed with its day and check, e.g. ['day_04 check_section_index ...']
+    mismatches = []
+    for day_name in day_names:
+        if day_name not in CHECKS:
+            continue
+        day = load_day(day_name)
+        for check in CHECKS[day_name]:
+            rng = random.Random(f'{day_name}-{check.__name__}-{seed}')
+            for _ in range(trials):
+                mismatches.extend(f'{day_name} {check.__name__} {mismatch}' for mismatch in check(day, rng))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check algorithms against brute-force scans on random inputs')
+    parser.add_argument('day_names', nargs='*', default=sorted(CHECKS), help='e.g. day_04 (default: all checked days)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--trials', type=int, default=200)
+    args = parser.parse_args()
+
+    mismatches = run_checks(args.day_names, args.seed, args.trials)
+    if mismatches:
+        print('Mismatches against brute force:', *mismatches, sep='\n')
+        sys.exit(1)
+    print('Checked:', *(day_name for day_name in args.day_names if day_name in CHECKS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,345 @@
+# Synthetic puzzle input generators, one per day
+# Every generator takes a size (what it scales is noted alongside) and a seeded Random, returning the input text
+
+import json
+from dataclasses import dataclass
+from itertools import chain, count, product
+from math import isqrt
+from string import ascii_lowercase, ascii_uppercase, digits
+from typing import Callable
+
+ITEM_LETTERS = ascii_lowercase + ascii_uppercase
+
+
+def count_lines(text):
+    return sum(1 for line in text.splitlines() if line)
+
+
+def count_characters(text):
+    return sum(len(line) for line in text.splitlines())
+
+
+@dataclass
+class Generator:
+    generate: Callable
+    # What "size" counts for this day, and the sizes benchmarked by default
+    unit: str
+    default_sizes: tuple
+    # Parts to benchmark, when some are too slow to be worth scaling
+    part_names: tuple = None
+    # How many records (e.g. lines, trees) a generated input holds, for measuring memory per record
+    count_records: Callable = count_lines
+
+
+def generate_day_01(size, rng):
+    return '\n\n'.join('\n'.join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))) for _ in range(size))
+
+
+def generate_day_02(size, rng):
+    return '\n'.join(f'{rng.choice("ABC")} {rng.choice("XYZ")}' for _ in range(size))
+
+
+def generate_day_03(size, rng, group_size=3, compartment_size=12):
+    rucksacks = []
+    for _ in range(-(-size // group_size)):
+        letters = rng.sample(ITEM_LETTERS, len(ITEM_LETTERS))
+        badge, letters = letters[0], letters[1:]
+        # Each rucksack in the group draws from its own letters, so the badge is the only item shared by the group
+        own_letters_count = len(letters) // group_size
+        for i in range(group_size):
+            own_letters = letters[i * own_letters_count:(i + 1) * own_letters_count]
+            common_letter, half = own_letters[0], own_letters_count // 2
+            compartment_1 = [badge, common_letter] + rng.choices(own_letters[1:half + 1], k=compartment_size - 2)
+            compartment_2 = [common_letter] + rng.choices(own_letters[half + 1:], k=compartment_size - 1)
+            rng.shuffle(compartment_1)
+            rng.shuffle(compartment_2)
+            rucksacks.append(''.join(compartment_1 + compartment_2))
+    return '\n'.join(rucksacks)
+
+
+def generate_day_04(size, rng):
+    def assignment_str():
+        start_id = rng.randint(1, 99)
+        return f'{start_id}-{rng.randint(start_id, 99)}'
+
+    return '\n'.join(f'{assignment_str()},{assignment_str()}' for _ in range(size))
+
+
+def generate_day_05(size, rng, stack_count=9):
+    # Stacks get taller as the number of procedures grows
+    max_height = max(8, isqrt(size))
+    heights = [max_height] + [rng.randint(1, max_height) for _ in range(stack_count - 1)]
+    stacks = [[rng.choice(ascii_uppercase) for _ in range(height)] for height in heights]
+    # Every deck layout row must be padded to the same width
+    deck_layout = [' '.join(f'[{stack[level]}]' if level < len(stack) else '   ' for stack in stacks)
+                   for level in reversed(range(max_height))]
+    deck_layout.append(' '.join(f' {stack_id} ' for stack_id in range(1, stack_count + 1)))
+
+    procedures = []
+    for _ in range(size):
+        # Never empty a stack, every stack needs a top crate at the end
+        source_id = rng.choice([stack_id for stack_id, height in enumerate(heights) if height > 1])
+        target_id = rng.choice([stack_id for stack_id in range(stack_count) if stack_id != source_id])
+        quantity = rng.randint(1, heights[source_id] - 1)
+        heights[source_id] -= quantity
+        heights[target_id] += quantity
+        procedures.append(f'move {quantity} from {source_id + 1} to {target_id + 1}')
+    return '\n'.join(deck_layout) + '\n\n' + '\n'.join(procedures)
+
+
+def generate_day_06(size, rng, marker_length=14):
+    # Three letters can never form a marker, so both markers are only found at the very end
+    filler = ''.join(rng.choice('abc') for _ in range(max(0, size - marker_length)))
+    return filler + ''.join(rng.sample(ascii_lowercase, marker_length))
+
+
+def generate_day_07(size, rng, max_files=5, max_used_space=40000000):
+    # Directory 0 is the root, every other directory picks a random earlier directory as its parent
+    parent_ids = [None] + [rng.randrange(directory_id) for directory_id in range(1, size + 1)]
+    children = [[] for _ in parent_ids]
+    for directory_id, parent_id in enumerate(parent_ids[1:], start=1):
+        children[parent_id].append(directory_id)
+    file_sizes = [[rng.randint(1, 300000) for _ in range(rng.randint(0, max_files))] for _ in parent_ids]
+
+    # Scale the file sizes so that, with 40000000 of 70000000 usable, deleting the root's largest subdirectory
+    # frees up twice the space required
+    total_sizes = list(map(sum, file_sizes))
+    for directory_id in reversed(range(1, size + 1)):
+        total_sizes[parent_ids[directory_id]] += total_sizes[directory_id]
+    largest_size = max((total_sizes[child_id] for child_id in children[0]), default=0)
+    scale = max_used_space / (total_sizes[0] - largest_size / 2) if largest_size else 1
+
+    lines = ['$ cd /']
+
+    def explore(directory_id):
+        lines.append('$ ls')
+        lines.extend(f'dir d{child_id}' for child_id in children[directory_id])
+        lines.extend(f'{max(1, round(file_size * scale))} f{i}.txt'
+                     for i, file_size in enumerate(file_sizes[directory_id]))
+        for child_id in children[directory_id]:
+            lines.append(f'$ cd d{child_id}')
+            explore(child_id)
+            lines.append('$ cd ..')
+
+    explore(0)
+    return '\n'.join(lines)
+
+
+def generate_day_08(size, rng):
+    return '\n'.join(''.join(rng.choices(digits, k=size)) for _ in range(size))
+
+
+def generate_day_09(size, rng):
+    return '\n'.join(f'{rng.choice("LRUD")} {rng.randint(1, 20)}' for _ in range(size))
+
+
+def generate_day_10(size, rng, min_cycles=240):
+    # Every addx takes 2 cycles, so this many instructions always covers the CRT
+    instructions = ['noop' if rng.random() < 0.3 else f'addx {rng.randint(-10, 10)}'
+                    for _ in range(max(size, min_cycles))]
+    return '\n'.join(instructions)
+
+
+def get_primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate_day_11(size, rng):
+    monkey_infos = []
+    for monkey_id, test_value in enumerate(get_primes(max(size, 3))):
+        others = [other_id for other_id in range(max(size, 3)) if other_id != monkey_id]
+        true_monkey_id, false_monkey_id = rng.sample(others, 2)
+        # No "old * old", part 1 has no modulus to keep repeated squaring in check
+        operation = rng.choice([f'* {rng.randint(2, 19)}', f'+ {rng.randint(1, 8)}'])
+        starting_items = ', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 5)))
+        monkey_infos.append(f'Monkey {monkey_id}:\n'
+                            f'  Starting items: {starting_items}\n'
+                            f'  Operation: new = old {operation}\n'
+                            f'  Test: divisible by {test_value}\n'
+                            f'    If true: throw to monkey {true_monkey_id}\n'
+                            f'    If false: throw to monkey {false_monkey_id}')
+    return '\n\n'.join(monkey_infos)
+
+
+def generate_day_12(size, rng):
+    # A diagonal slope that never climbs more than one step at a time guarantees a path from S to E
+    size = max(size, 14)
+    rows = [[ascii_lowercase[(x + y) * 25 // (2 * size - 2)] for x in range(size)] for y in range(size)]
+    rows[0][0] = 'S'
+    rows[-1][-1] = 'E'
+    # Sprinkle in some lower ground away from the edges, the untouched top and right edges always lead from S to E
+    for _ in range(size * size // 10):
+        x, y = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        if rows[y][x] not in 'aSE':
+            rows[y][x] = chr(ord(rows[y][x]) - 1)
+    return '\n'.join(''.join(row) for row in rows)
+
+
+def generate_day_13(size, rng, max_depth=3):
+    def packet(depth=0):
+        return [rng.randint(0, 10) if depth == max_depth or rng.random() < 0.6 else packet(depth + 1) for _ in
+                range(rng.randint(0, 5))]
+
+    pairs = (f'{json.dumps(packet(), separators=(",", ":"))}\n{json.dumps(packet(), separators=(",", ":"))}' for _ in
+             range(size))
+    return '\n\n'.join(pairs)
+
+
+def generate_day_14(size, rng, spawner_x=500):
+    # The first structure spans the bottom of the cave, so the cave depth is the size
+    rock_structures = [[(spawner_x - size // 2, size), (spawner_x + size // 2, size)]]
+    for _ in range(size // 4):
+        x, y = rng.randint(spawner_x - size, spawner_x + size), rng.randint(2, size)
+        points = [(x, y)]
+        while len(points) < 2 or rng.random() < 0.6:
+            # Rock paths alternate between horizontal and vertical lines
+            if len(points) % 2:
+                x += rng.choice((-1, 1)) * rng.randint(1, 5)
+            else:
+                y = min(max(y + rng.choice((-1, 1)) * rng.randint(1, 5), 2), size)
+            if (x, y) != points[-1]:
+                points.append((x, y))
+        rock_structures.append(points)
+    return '\n'.join(' -> '.join(f'{x},{y}' for x, y in points) for points in rock_structures)
+
+
+def generate_day_15(size, rng, bound=4000000, max_distress_y=100):
+    # The distress beacon sits in an early row, so part 2 stops quickly regardless of the size
+    distress_x, distress_y = rng.randint(0, bound), rng.randint(0, max_distress_y)
+    readouts = []
+
+    def add_readout(sensor_x, sensor_y, beacon_x, beacon_y):
+        readouts.append(f'Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at x={beacon_x}, y={beacon_y}')
+
+    # Four sensors diagonal to the distress beacon cover everything else within the bounds
+    for x_sign, y_sign in product((-1, 1), repeat=2):
+        sensor_x, sensor_y = distress_x + x_sign * bound, distress_y + y_sign * bound
+        add_readout(sensor_x, sensor_y, sensor_x - x_sign * (2 * bound - 1), sensor_y)
+
+    # Every other sensor must stop short of the distress beacon
+    while len(readouts) < size:
+        sensor_x, sensor_y = rng.randint(0, bound), rng.randint(0, bound)
+        distress_distance = abs(sensor_x - distress_x) + abs(sensor_y - distress_y)
+        if distress_distance < 2:
+            continue
+        scan_distance = rng.randint(1, distress_distance - 1)
+        x_distance = rng.randint(0, scan_distance)
+        add_readout(sensor_x, sensor_y, sensor_x + rng.choice((-1, 1)) * x_distance,
+                    sensor_y + rng.choice((-1, 1)) * (scan_distance - x_distance))
+    return '\n'.join(readouts)
+
+
+def generate_day_16(size, rng):
+    name_length = 2 if size <= 26 ** 2 else 3
+    names = [''.join(letters) for letters in product(ascii_uppercase, repeat=name_length)][:max(size, 2)]
+    linked_names = {name: set() for name in names}
+    # A random tree keeps every valve reachable from AA, then add a few shortcuts on top
+    for i, name in enumerate(names[1:], start=1):
+        other_name = names[rng.randrange(i)]
+        linked_names[name].add(other_name)
+        linked_names[other_name].add(name)
+    for _ in range(len(names) // 4):
+        name, other_name = rng.sample(names, 2)
+        linked_names[name].add(other_name)
+        linked_names[other_name].add(name)
+
+    # The traversal is exponential in working valves, so only a handful of valves have a flow rate
+    working_names = set(rng.sample(names[1:], min(len(names) - 1, 2 + len(names) // 5)))
+    readouts = []
+    for name in names:
+        flow_rate = rng.randint(2, 25) if name in working_names else 0
+        plural = 's' if len(linked_names[name]) > 1 else ''
+        linked_names_str = ', '.join(sorted(linked_names[name]))
+        readouts.append(f'Valve {name} has flow rate={flow_rate}; '
+                        f'tunnel{plural} lead{"" if plural else "s"} to valve{plural} {linked_names_str}')
+    return '\n'.join(readouts)
+
+
+def generate_day_17(size, rng):
+    return ''.join(rng.choices('<>', k=size))
+
+
+def generate_day_18(size, rng):
+    # Fill roughly a third of a cube of positions
+    side = max(2, round((size * 3) ** (1 / 3)))
+    positions = rng.sample(range(side ** 3), min(size, side ** 3))
+    return '\n'.join(f'{i % side},{i // side % side},{i // side ** 2}' for i in positions)
+
+
+def generate_day_19(size, rng):
+    return '\n'.join(f'Blueprint {blueprint_id}:'
+                     f' Each ore robot costs {rng.randint(2, 4)} ore.'
+                     f' Each clay robot costs {rng.randint(2, 4)} ore.'
+                     f' Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay.'
+                     f' Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian.'
+                     for blueprint_id in range(1, size + 1))
+
+
+def generate_day_20(size, rng):
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10000) for _ in range(max(size, 1) - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return '\n'.join(map(str, numbers))
+
+
+def generate_day_21(size, rng):
+    # Names are four letters long, like the puzzle's, until they run out
+    names = (name for name in map(''.join, chain.from_iterable(product(ascii_lowercase, repeat=n) for n in count(4))) if
+             name not in ('root', 'humn'))
+    lines = []
+    human_candidates = []
+
+    # The left branch always reaches the full depth, the right branch is either a subtree or a single number
+    def add_monkey(name, depth, is_divisor=False):
+        if depth == 0:
+            lines.append(f'{name}: {rng.randint(1, 20)}')
+            # The human dividing something would make part 2 non-linear
+            if not is_divisor:
+                human_candidates.append(name)
+            return
+        left_name, right_name = next(names), next(names)
+        right_depth = 0 if rng.random() < 0.5 else depth - 1
+        # Only ever multiply or divide by a (non-zero) number, so the human's equation stays linear and solvable
+        operand = rng.choice('+-*/') if right_depth == 0 else rng.choice('+-')
+        lines.append(f'{name}: {left_name} {operand} {right_name}')
+        add_monkey(left_name, depth - 1)
+        add_monkey(right_name, right_depth, is_divisor=operand == '/')
+
+    add_monkey('root', max(size, 2))
+    human_name = rng.choice(human_candidates)
+    return '\n'.join(line.replace(human_name, 'humn') for line in lines)
+
+
+GENERATORS = {
+    'day_01': Generator(generate_day_01, unit='elves', default_sizes=(1000, 10000, 100000)),
+    'day_02': Generator(generate_day_02, unit='rounds', default_sizes=(1000, 10000, 100000)),
+    'day_03': Generator(generate_day_03, unit='rucksacks', default_sizes=(300, 3000, 30000)),
+    'day_04': Generator(generate_day_04, unit='teams', default_sizes=(1000, 10000, 100000)),
+    'day_05': Generator(generate_day_05, unit='procedures', default_sizes=(10000, 100000, 1000000)),
+    'day_06': Generator(generate_day_06, unit='characters', default_sizes=(10000, 100000, 1000000),
+                        count_records=count_characters),
+    'day_07': Generator(generate_day_07, unit='directories', default_sizes=(100, 1000, 10000)),
+    'day_08': Generator(generate_day_08, unit='grid width', default_sizes=(50, 100, 200),
+                        count_records=count_characters),
+    'day_09': Generator(generate_day_09, unit='movements', default_sizes=(100, 1000, 10000)),
+    'day_10': Generator(generate_day_10, unit='instructions', default_sizes=(240, 2400, 24000)),
+    'day_11': Generator(generate_day_11, unit='monkeys', default_sizes=(4, 8, 16)),
+    'day_12': Generator(generate_day_12, unit='grid width', default_sizes=(20, 40, 80),
+                        count_records=count_characters),
+    'day_13': Generator(generate_day_13, unit='packet pairs', default_sizes=(100, 1000, 10000)),
+    'day_14': Generator(generate_day_14, unit='cave depth', default_sizes=(20, 40, 80)),
+    'day_15': Generator(generate_day_15, unit='sensors', default_sizes=(10, 100, 1000)),
+    'day_16': Generator(generate_day_16, unit='valves', default_sizes=(10, 20, 30)),
+    'day_17': Generator(generate_day_17, unit='jets', default_sizes=(100, 1000, 10000),
+                        count_records=count_characters),
+    'day_18': Generator(generate_day_18, unit='cubes', default_sizes=(100, 300, 1000)),
+    # Part 2 takes minutes for even a single blueprint
+    'day_19': Generator(generate_day_19, unit='blueprints', default_sizes=(1, 2, 4), part_names=('part_1',)),
+    'day_20': Generator(generate_day_20, unit='numbers', default_sizes=(100, 1000, 5000)),
+    'day_21': Generator(generate_day_21, unit='tree depth', default_sizes=(8, 12, 16)),
+}
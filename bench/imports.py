@@ -0,0 +1,90 @@
+# Measures how long importing each day's main.py takes, using python -X importtime
+# Usage (from the repository root): python -m bench.imports [day_01 ...] [--save imports.json] [--baseline imports.json]
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from common.days import ROOT_PATH, get_day_names
+
+# Example: "import time:       353 |       1262 |   networkx.utils"
+IMPORT_TIME_PATTERN = re.compile(
+    r'import time:\s+(?P<self_us>\d+) \|\s+(?P<cumulative_us>\d+) \|(?P<indent> +)(?P<name>\S+)')
+
+
+@dataclass
+class ImportTime:
+    name: str
+    level: int
+    cumulative_us: int
+
+
+def get_import_times(day_name):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], cwd=ROOT_PATH / day_name,
+                            env={**os.environ, 'PYTHONPATH': str(ROOT_PATH)}, capture_output=True, text=True,
+                            check=True)
+    import_times = []
+    for line in result.stderr.splitlines():
+        if m := IMPORT_TIME_PATTERN.match(line):
+            # Nested imports are indented by two more spaces per level
+            import_times.append(ImportTime(m['name'], len(m['indent']) // 2, int(m['cumulative_us'])))
+    return import_times
+
+
+def measure(day_name, repeat):
+    # The fastest of several runs is the least affected by noise
+    best_import_times = None
+    for _ in range(repeat):
+        import_times = get_import_times(day_name)
+        main_index = next(i for i, import_time in enumerate(import_times) if import_time.name == 'main')
+        if best_import_times is None or import_times[main_index].cumulative_us < best_import_times[0].cumulative_us:
+            # Imports are listed after everything they import, so main's own imports come just before it
+            children = []
+            for import_time in reversed(import_times[:main_index]):
+                if import_time.level == 0:
+                    break
+                if import_time.level == 1:
+                    children.append(import_time)
+            best_import_times = [import_times[main_index], *children]
+    return best_import_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of each day's main.py")
+    parser.add_argument('day_names', nargs='*', default=get_day_names(), help='e.g. day_01 (default: all days)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', help='write the import times (in microseconds) to this JSON file')
+    parser.add_argument('--baseline', help='fail if any day imports slower than in this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown over the baseline (default: 50%%)')
+    args = parser.parse_args()
+
+    totals = {}
+    for day_name in args.day_names:
+        main_import_time, *children = measure(day_name, args.repeat)
+        totals[day_name] = main_import_time.cumulative_us
+        slowest = ', '.join(f'{child.name} {child.cumulative_us / 1000:.1f}ms' for child in
+                            sorted(children, key=lambda child: child.cumulative_us, reverse=True)[:3])
+        print(f'{day_name} {main_import_time.cumulative_us / 1000:8.1f}ms ({slowest})')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(totals, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = [f'{day_name}: {baseline[day_name] / 1000:.1f}ms -> {total / 1000:.1f}ms' for
+                       day_name, total in totals.items() if
+                       day_name in baseline and total > baseline[day_name] * (1 + args.tolerance)]
+        if regressions:
+            print('Import time regressions:', *regressions, sep='\n')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
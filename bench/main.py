@@ -0,0 +1,122 @@
+# Benchmarks every day's solver against synthetic inputs of increasing size, to show how each one scales
+# Usage (from the repository root): python -m bench.main [day_01 day_08 ...] [--sizes 100 1000] [--output bench.json]
+# With --memory, only memory is measured: the peak, and how much the parsed data holds on to per input record
+# Days that solve as they stream their input (Solution.streamed) have parsing and solving timed as one phase
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, asdict
+from multiprocessing import Pool
+from pathlib import Path
+
+from bench.generators import GENERATORS
+from common.days import load_solution
+from common.solution import STREAMED_PHASE_NAME
+
+
+@dataclass
+class Measurement:
+    day_name: str
+    size: int
+    unit: str
+    records: int
+    # Timings are left out when only measuring memory, and parse_seconds when streamed (solve_seconds covers both)
+    parse_seconds: float | None
+    solve_seconds: float | None
+    part_seconds: dict | None
+    peak_bytes: int
+    # Memory still held by the data once parsed and precomputed, i.e. what the parts are handed (None when streamed)
+    parsed_bytes: int | None
+
+    @property
+    def bytes_per_record(self):
+        if self.parsed_bytes is None:
+            return None
+        return self.parsed_bytes / self.records if self.records else 0
+
+
+def time_day(day_name, file_name, trace_memory=False):
+    # Runs in a fresh process, so module level state (e.g. caches) never leaks between measurements
+    solution = load_solution(day_name)
+    parts = solution.parts
+    part_names = GENERATORS[day_name].part_names or parts.keys()
+    if trace_memory:
+        tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = solution.prepare(file_name)
+        parsed_bytes = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+        for part_name in part_names:
+            solution.time_phase(part_name, parts[part_name], data)
+    peak_bytes = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    tracemalloc.stop()
+    if solution.streamed:
+        # Streamed data is only read as the parts run, so neither its parse time nor its size mean anything alone
+        streamed_seconds = solution.get_phase_stopwatches()[STREAMED_PHASE_NAME].wall_seconds
+        return None, {STREAMED_PHASE_NAME: streamed_seconds}, peak_bytes, None
+    # Precomputing is part of getting the data ready, so it counts towards parsing
+    parse_seconds = solution.stopwatches['parse'].wall_seconds + solution.stopwatches['precompute'].wall_seconds
+    part_seconds = {part_name: solution.stopwatches[part_name].wall_seconds for part_name in part_names}
+    return parse_seconds, part_seconds, peak_bytes, parsed_bytes
+
+
+def write_input(directory, day_name, size, seed):
+    generator = GENERATORS[day_name]
+    text = generator.generate(size, random.Random(f'{day_name}-{size}-{seed}'))
+    file_path = Path(directory) / f'{day_name}_{size}.txt'
+    file_path.write_text(text)
+    return str(file_path), generator.count_records(text)
+
+
+def benchmark(day_name, size, file_name, records, pool, memory_only=False):
+    # Tracing memory slows everything down, so timings and memory come from separate runs
+    parse_seconds, part_seconds = None, None
+    if not memory_only:
+        parse_seconds, part_seconds, *_ = pool.apply(time_day, (day_name, file_name))
+    *_, peak_bytes, parsed_bytes = pool.apply(time_day, (day_name, file_name, True))
+    return Measurement(day_name, size, GENERATORS[day_name].unit, records, parse_seconds,
+                       sum(part_seconds.values()) if part_seconds else None, part_seconds, peak_bytes, parsed_bytes)
+
+
+def print_measurement(measurement):
+    if measurement.solve_seconds is None:
+        timings = ''
+    elif measurement.parse_seconds is None:
+        timings = f' parse+solve {measurement.solve_seconds:20.4f}s'
+    else:
+        timings = f' parse {measurement.parse_seconds:9.4f}s solve {measurement.solve_seconds:9.4f}s'
+    parsed = 'streamed' if measurement.bytes_per_record is None else f'{measurement.bytes_per_record:9.1f} B/record'
+    print(f'{measurement.day_name} {measurement.size:>9} {measurement.unit:<13}{timings}'
+          f' peak {measurement.peak_bytes / 1024 ** 2:9.2f} MiB parsed {parsed}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark solvers against generated inputs of increasing size')
+    parser.add_argument('day_names', nargs='*', default=sorted(GENERATORS), help='e.g. day_01 (default: all days)')
+    parser.add_argument('--sizes', nargs='+', type=int, help="overrides each day's default sizes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--memory', action='store_true', help='only measure memory')
+    parser.add_argument('--output', help='also write the measurements to this JSON file')
+    args = parser.parse_args()
+
+    measurements = []
+    with tempfile.TemporaryDirectory() as directory, Pool(processes=1, maxtasksperchild=1) as pool:
+        for day_name in args.day_names:
+            for size in args.sizes or GENERATORS[day_name].default_sizes:
+                file_name, records = write_input(directory, day_name, size, args.seed)
+                measurement = benchmark(day_name, size, file_name, records, pool, memory_only=args.memory)
+                print_measurement(measurement)
+                measurements.append(measurement)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump([{**asdict(measurement), 'bytes_per_record': measurement.bytes_per_record} for measurement in
+                       measurements], f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
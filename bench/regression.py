@@ -0,0 +1,125 @@
+# Guards against performance regressions: benchmarks each day on a fixed generated input and compares its time and peak
+# memory against a committed baseline, failing with a per-day diff when either grows past the tolerance
+# Usage (from the repository root): python -m bench.regression [day_01 ...] [--baseline baseline.json] [--update]
+
+import argparse
+import json
+import sys
+import tempfile
+from dataclasses import dataclass, asdict
+from multiprocessing import Pool
+
+from bench.checks import run_checks
+from bench.generators import GENERATORS
+from bench.main import time_day, write_input
+from common.days import ROOT_PATH
+
+BASELINE_PATH = ROOT_PATH / 'bench' / 'baseline.json'
+
+
+@dataclass
+class Result:
+    size: int
+    seed: int
+    seconds: float
+    peak_bytes: int
+
+
+def get_regression_size(day_name):
+    # The middle default size is large enough to expose poor scaling (e.g. quadratic loops), yet quick to run
+    default_sizes = GENERATORS[day_name].default_sizes
+    return default_sizes[len(default_sizes) // 2]
+
+
+def measure(day_name, directory, pool, seed, repeat):
+    size = get_regression_size(day_name)
+    file_name, _ = write_input(directory, day_name, size, seed)
+    # The fastest of several runs is the least affected by noise
+    seconds = None
+    for _ in range(repeat):
+        parse_seconds, part_seconds, *_ = pool.apply(time_day, (day_name, file_name))
+        # Streamed days have no separate parse time, as it is part of solving
+        total_seconds = (parse_seconds or 0) + sum(part_seconds.values())
+        seconds = total_seconds if seconds is None else min(seconds, total_seconds)
+    *_, peak_bytes, _ = pool.apply(time_day, (day_name, file_name, True))
+    return Result(size, seed, seconds, peak_bytes)
+
+
+def format_change(before, after):
+    return f'{(after - before) / before:+.0%}' if before else 'new'
+
+
+def compare(day_name, result, baseline_result, tolerance, memory_tolerance, min_seconds):
+    # Returns the regressions found, e.g. ['day_07 time 0.0120s -> 0.0510s (+325%)']
+    regressions = []
+    if (result.seconds > baseline_result.seconds * (1 + tolerance) and
+            result.seconds - baseline_result.seconds > min_seconds):
+        regressions.append(f'{day_name} time {baseline_result.seconds:.4f}s -> {result.seconds:.4f}s'
+                           f' ({format_change(baseline_result.seconds, result.seconds)})')
+    if result.peak_bytes > baseline_result.peak_bytes * (1 + memory_tolerance):
+        regressions.append(f'{day_name} peak {baseline_result.peak_bytes / 1024 ** 2:.2f} MiB ->'
+                           f' {result.peak_bytes / 1024 ** 2:.2f} MiB'
+                           f' ({format_change(baseline_result.peak_bytes, result.peak_bytes)})')
+    return regressions
+
+
+def load_baseline(file_name):
+    try:
+        with open(file_name) as f:
+            return {day_name: Result(**result) for day_name, result in json.load(f).items()}
+    except FileNotFoundError:
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare solver time and peak memory against a stored baseline')
+    parser.add_argument('day_names', nargs='*', default=sorted(GENERATORS), help='e.g. day_01 (default: all days)')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='default: bench/baseline.json')
+    parser.add_argument('--update', action='store_true', help='store the measurements as the new baseline')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=0.5, help='allowed slowdown (default: 50%%)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.2,
+                        help='allowed peak memory growth (default: 20%%)')
+    parser.add_argument('--min-seconds', type=float, default=0.01,
+                        help='slowdowns smaller than this are treated as noise (default: 0.01)')
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as directory, Pool(processes=1, maxtasksperchild=1) as pool:
+        # A faster but wrong answer is no improvement, so the days' algorithms are checked before anything is measured,
+        # in a process of their own so that nothing they import is already loaded when the days are timed
+        mismatches = pool.apply(run_checks, (args.day_names, args.seed))
+        if mismatches:
+            print('Mismatches against brute force:', *mismatches, sep='\n')
+            sys.exit(1)
+        for day_name in args.day_names:
+            result = measure(day_name, directory, pool, args.seed, args.repeat)
+            results[day_name] = result
+            baseline_result = baseline.get(day_name)
+            # A baseline for a different input says nothing about this one
+            if baseline_result and (baseline_result.size, baseline_result.seed) != (result.size, result.seed):
+                baseline_result = None
+            comparison = '(no baseline)' if baseline_result is None else (
+                f'({format_change(baseline_result.seconds, result.seconds)} time,'
+                f' {format_change(baseline_result.peak_bytes, result.peak_bytes)} peak)')
+            print(f'{day_name} {result.size:>9} {GENERATORS[day_name].unit:<13} {result.seconds:9.4f}s'
+                  f' peak {result.peak_bytes / 1024 ** 2:9.2f} MiB {comparison}')
+            if baseline_result and not args.update:
+                regressions.extend(compare(day_name, result, baseline_result, args.tolerance, args.memory_tolerance,
+                                           args.min_seconds))
+
+    if args.update:
+        # Days that were not measured keep their previous baseline
+        with open(args.baseline, 'w') as f:
+            json.dump({day_name: asdict(result) for day_name, result in sorted({**baseline, **results}.items())}, f,
+                      indent=2)
+    elif regressions:
+        print('Performance regressions:', *regressions, sep='\n')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# Opt-in on-disk cache for get_data() and Solution.parse(), enabled by setting AOC_CACHE=1
+# Entries are keyed by the input file's content, the day's source code and the other arguments given to the parser,
+# stored as compressed pickles and evicted least recently used first once the cache grows past AOC_CACHE_MAX_BYTES
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import zlib
+from pathlib import Path
+
+CACHE_PATH = Path(__file__).resolve().parent.parent / '.aoc_cache'
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+
+def is_enabled():
+    return os.environ.get('AOC_CACHE', '') not in ('', '0')
+
+
+def get_max_bytes():
+    return int(os.environ.get('AOC_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+
+
+def hash_file(file_name):
+    file_hash = hashlib.sha256()
+    with open(file_name, 'rb') as f:
+        while chunk := f.read(1024 ** 2):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+@functools.cache
+def hash_code(directory):
+    # Any change to the day's code (e.g. shapes.py alongside main.py) invalidates its entries
+    code_hash = hashlib.sha256()
+    for file_path in sorted(Path(directory).glob('*.py')):
+        code_hash.update(file_path.read_bytes())
+    return code_hash.hexdigest()
+
+
+def get_key(get_data, arguments):
+    key = hashlib.sha256()
+    # The module name matters too, as pickles refer to their classes by module (e.g. __main__ vs day_16.main)
+    key.update(f'{get_data.__module__}.{get_data.__qualname__}'.encode())
+    key.update(hash_code(Path(inspect.getfile(get_data)).parent).encode())
+    for name, value in arguments.items():
+        # Solution.parse() is a method, and the instance it is called on has nothing to do with what it returns
+        if name == 'self':
+            continue
+        value = hash_file(value) if name == 'file_name' else repr(value)
+        key.update(f'{name}={value}'.encode())
+    return key.hexdigest()
+
+
+def load(cache_file_path):
+    try:
+        data = pickle.loads(zlib.decompress(cache_file_path.read_bytes()))
+    except (OSError, zlib.error, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+        return None
+    # Mark the entry as recently used
+    cache_file_path.touch()
+    return data
+
+
+def store(cache_file_path, data):
+    CACHE_PATH.mkdir(exist_ok=True)
+    temp_file_path = cache_file_path.with_suffix(f'.{os.getpid()}.tmp')
+    temp_file_path.write_bytes(zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), level=1))
+    os.replace(temp_file_path, cache_file_path)
+    evict(get_max_bytes())
+
+
+def evict(max_bytes):
+    cache_file_paths = sorted(CACHE_PATH.glob('*.cache'), key=lambda file_path: file_path.stat().st_mtime, reverse=True)
+    total_bytes = 0
+    for cache_file_path in cache_file_paths:
+        total_bytes += cache_file_path.stat().st_size
+        if total_bytes > max_bytes:
+            cache_file_path.unlink(missing_ok=True)
+
+
+def cached_data(get_data):
+    # Example: decorating get_data(file_name='input.txt') makes repeated runs skip straight to the parsed data
+    signature = inspect.signature(get_data)
+
+    @functools.wraps(get_data)
+    def wrapper(*args, **kwargs):
+        if not is_enabled():
+            return get_data(*args, **kwargs)
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        cache_file_path = CACHE_PATH / f'{get_key(get_data, arguments.arguments)}.cache'
+        if (data := load(cache_file_path)) is not None:
+            return data
+        data = get_data(*args, **kwargs)
+        store(cache_file_path, data)
+        return data
+
+    return wrapper
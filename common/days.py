@@ -0,0 +1,28 @@
+# Discovery and loading of the day_XX solutions
+
+import importlib
+import re
+import sys
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+DAY_NAME_PATTERN = re.compile(r'day_\d{2}')
+TEMPLATE_DAY_NAME = 'day_00'
+
+
+def get_day_names():
+    return sorted(path.name for path in ROOT_PATH.iterdir() if
+                  path.is_dir() and DAY_NAME_PATTERN.fullmatch(path.name) and path.name != TEMPLATE_DAY_NAME)
+
+
+def load_day(day_name):
+    # Days import their sibling modules directly (e.g. "from shapes import ..."), so their directory must be on the path
+    for path in (ROOT_PATH, ROOT_PATH / day_name):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    return importlib.import_module(f'{day_name}.main')
+
+
+def load_solution(day_name):
+    # Example: load_solution('day_05').solve(file_name) parses once, then solves both parts (see common.solution)
+    return load_day(day_name).DaySolution()
@@ -0,0 +1,97 @@
+# Opt-in instrumentation for hot functions, enabled by setting AOC_INSTRUMENT=1
+# Counts calls and accumulates time per function (or timed block), printing a table to stderr at exit
+# When disabled, @instrumented returns the function untouched, so there is no overhead at all
+
+import atexit
+import contextlib
+import functools
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+ENABLED = os.environ.get('AOC_INSTRUMENT', '') not in ('', '0')
+
+
+@dataclass
+class Stats:
+    calls: int = 0
+    seconds: float = 0
+    # Recursive functions (e.g. Packet.compare) are only timed at their outermost call to avoid double counting
+    depth: int = 0
+    start_time: float = 0
+
+    def enter(self):
+        self.calls += 1
+        self.depth += 1
+        if self.depth == 1:
+            self.start_time = time.perf_counter()
+
+    def exit(self):
+        self.depth -= 1
+        if self.depth == 0:
+            self.seconds += time.perf_counter() - self.start_time
+
+
+all_stats: dict[str, Stats] = {}
+
+
+def get_stats(name):
+    if name not in all_stats:
+        all_stats[name] = Stats()
+    return all_stats[name]
+
+
+def instrumented(func):
+    if not ENABLED:
+        return func
+    stats = get_stats(func.__qualname__)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats.enter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.exit()
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def _timed(name):
+    stats = get_stats(name)
+    stats.enter()
+    try:
+        yield
+    finally:
+        stats.exit()
+
+
+def timed(name):
+    # Example: with timed('parse'): ...
+    return _timed(name) if ENABLED else contextlib.nullcontext()
+
+
+def pop_stats():
+    # Worker processes never run atexit handlers, so they hand their stats back instead
+    stats_by_name = {name: {'calls': stats.calls, 'seconds': stats.seconds} for name, stats in all_stats.items() if
+                     stats.calls}
+    for stats in all_stats.values():
+        stats.calls = 0
+        stats.seconds = 0
+    return stats_by_name
+
+
+def print_report(file=sys.stderr):
+    if not all_stats:
+        return
+    name_width = max(map(len, all_stats))
+    print(f'{"Function":<{name_width}} {"Calls":>12} {"Seconds":>10} {"us/Call":>10}', file=file)
+    for name, stats in sorted(all_stats.items(), key=lambda item: item[1].seconds, reverse=True):
+        us_per_call = stats.seconds / stats.calls * 1e6 if stats.calls else 0
+        print(f'{name:<{name_width}} {stats.calls:>12} {stats.seconds:>10.4f} {us_per_call:>10.2f}', file=file)
+
+
+if ENABLED:
+    atexit.register(print_report)
@@ -0,0 +1,20 @@
+# Defers importing heavy libraries (networkx, sympy, numpy) until one of their attributes is first used
+# Example: nx = lazy_import('networkx') costs nothing until nx.Graph() is called
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        # Fail the same way a plain "import name" would
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
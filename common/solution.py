@@ -0,0 +1,106 @@
+# Base class for a day's solution: parse the input once, precompute anything the parts share, then solve every part
+# from that same data, timing each phase along the way
+# Set AOC_TIMINGS=1 to have main() print the phase timings to stderr
+
+import os
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+
+from common.cache import cached_data
+
+PART_NAME_PATTERN = re.compile(r'parts?_\d+(_\d+)*')
+STREAMED_PHASE_NAME = 'parse_and_solve'
+
+
+class Stopwatch:
+    def __init__(self):
+        self.wall_seconds = 0
+        self.cpu_seconds = 0
+
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_seconds = time.perf_counter() - self.wall_start
+        self.cpu_seconds = time.process_time() - self.cpu_start
+
+    def __add__(self, other):
+        stopwatch = Stopwatch()
+        stopwatch.wall_seconds = self.wall_seconds + other.wall_seconds
+        stopwatch.cpu_seconds = self.cpu_seconds + other.cpu_seconds
+        return stopwatch
+
+    def to_dict(self):
+        return {'wall_seconds': self.wall_seconds, 'cpu_seconds': self.cpu_seconds}
+
+
+class Solution(ABC):
+    # Subclasses implement parse() and their parts as methods named part_1, part_2 (or parts_1_2 for a combined part)
+    # Setting cached = True caches what parse() returns on disk, when enabled by AOC_CACHE=1 (see common.cache)
+    cached = False
+    # Setting streamed = True marks a parse() that returns a stream only read as the parts run, or that solves as it
+    # reads the input (or a precompute() that solves every part): its time says nothing on its own, so parsing and
+    # solving are reported as a single phase
+    streamed = False
+    # How many processes parse() may split its work across. It stays 1 unless the caller asks for more: the runner and
+    # the benchmarks already solve each day in a pool worker, and those cannot start processes of their own
+    processes = 1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('cached') and 'parse' in cls.__dict__:
+            cls.parse = cached_data(cls.parse)
+
+    def __init__(self):
+        # Example: {'parse': Stopwatch, 'precompute': Stopwatch, 'part_1': Stopwatch, 'part_2': Stopwatch}
+        self.stopwatches = {}
+
+    @abstractmethod
+    def parse(self, file_name):
+        pass
+
+    def precompute(self, data):
+        # Anything more than one part needs can be derived here once, instead of in every part
+        return data
+
+    @property
+    def parts(self):
+        # Parts must not mutate the data they are given, as the parts after them share it
+        return {name: getattr(self, name) for name in dir(self) if PART_NAME_PATTERN.fullmatch(name)}
+
+    def time_phase(self, phase_name, phase, *args):
+        with Stopwatch() as stopwatch:
+            result = phase(*args)
+        self.stopwatches[phase_name] = stopwatch
+        return result
+
+    def prepare(self, file_name='input.txt'):
+        data = self.time_phase('parse', self.parse, file_name)
+        return self.time_phase('precompute', self.precompute, data)
+
+    def solve(self, file_name='input.txt'):
+        data = self.prepare(file_name)
+        for part_name, part in self.parts.items():
+            self.time_phase(part_name, part, data)
+        return data
+
+    def get_phase_stopwatches(self):
+        # Example: self.stopwatches, or {'parse_and_solve': Stopwatch} when streamed
+        if self.streamed:
+            return {STREAMED_PHASE_NAME: sum(self.stopwatches.values(), Stopwatch())}
+        return self.stopwatches
+
+    def print_timings(self):
+        for phase_name, stopwatch in self.get_phase_stopwatches().items():
+            print(f'{phase_name:<15} {stopwatch.wall_seconds:9.4f}s wall {stopwatch.cpu_seconds:9.4f}s cpu',
+                  file=sys.stderr)
+
+    def main(self):
+        data = self.solve()
+        if os.environ.get('AOC_TIMINGS', '') not in ('', '0'):
+            self.print_timings()
+        return data
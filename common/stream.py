@@ -0,0 +1,54 @@
+# Streaming readers for line oriented inputs, so an input never has to be held in memory all at once
+
+import mmap
+import os
+
+
+def iter_lines(file_name, use_mmap=False):
+    # Example: 'A Y\nB X\n' yields 'A Y' then 'B X'
+    if not use_mmap:
+        with open(file_name) as f:
+            for line in f:
+                yield line.rstrip('\n')
+        return
+    # Empty files cannot be memory-mapped
+    if os.path.getsize(file_name) == 0:
+        return
+    with open(file_name, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        for line in iter(m.readline, b''):
+            yield line.rstrip(b'\r\n').decode()
+
+
+def iter_records(file_name, use_mmap=False):
+    # Example: '1\n2\n\n3\n' yields ['1', '2'] then ['3']
+    record = []
+    for line in iter_lines(file_name, use_mmap):
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def get_line_aligned_ranges(file_name, chunk_bytes):
+    # Splits a file into (start, end) byte ranges of about chunk_bytes each, always ending just after a newline, so
+    # each range holds whole lines and can be processed on its own (e.g. in another process)
+    file_bytes = os.path.getsize(file_name)
+    ranges = []
+    with open(file_name, 'rb') as f:
+        start = 0
+        while start < file_bytes:
+            f.seek(min(start + chunk_bytes, file_bytes))
+            # Finish the line the range would otherwise end in the middle of
+            f.readline()
+            ranges.append((start, f.tell()))
+            start = f.tell()
+    return ranges
+
+
+def read_range(file_name, start, end):
+    with open(file_name, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
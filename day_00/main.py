@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass
 
+from common.solution import Solution
+
 
 def get_data(file_name='input.txt'):
     with open(file_name) as f:
@@ -12,8 +14,19 @@ def run():
     pass
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, data):
+        run()
+
+    def part_2(self, data):
+        run()
+
+
 def main():
-    pass
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,36 +1,117 @@
 # https://adventofcode.com/2022/day/1
 
+import heapq
+import os
+from array import array
 from dataclasses import dataclass
 
+from common.lazy import lazy_import
+from common.solution import Solution
+from common.stream import iter_records
 
-@dataclass
+# Only large inputs are parsed with NumPy
+np = lazy_import('numpy')
+
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+DIGIT_ZERO = ord('0')
+# Below this, streaming is quicker than importing NumPy
+VECTORIZED_MIN_BYTES = 1024 ** 2
+
+
+@dataclass(slots=True)
 class Elf:
-    items: list
+    # Packed machine integers rather than a list of int objects
+    items: array
 
     @property
     def total_calories(self):
         return sum(self.items)
 
 
+def iter_elves(file_name='input.txt'):
+    for items in iter_records(file_name):
+        yield Elf(array('q', map(int, items)))
+
+
+def iter_total_calories(file_name='input.txt'):
+    # Only each elf's total is kept, never their items
+    for items in iter_records(file_name):
+        yield sum(map(int, items))
+
+
+def get_total_calories_array(file_name='input.txt'):
+    # Parses the whole file as one byte buffer, e.g. b'1\n20\n\n3\n' -> [21, 3]
+    with open(file_name, 'rb') as f:
+        data = f.read()
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if b'\r' in data:
+        buffer = buffer[buffer != CARRIAGE_RETURN]
+    if len(buffer) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if buffer[-1] != NEWLINE:
+        buffer = np.append(buffer, np.uint8(NEWLINE))
+    newline_indices = np.flatnonzero(buffer == NEWLINE)
+    line_start_indices = np.concatenate(([0], newline_indices[:-1] + 1))
+    line_lengths = newline_indices - line_start_indices
+    # Numbers are converted right to left, one digit position at a time across every line at once
+    digits = buffer - np.uint8(DIGIT_ZERO)
+    line_values = np.zeros(len(line_lengths), dtype=np.int64)
+    for exponent in range(line_lengths.max()):
+        # Lines shorter than this pick up a byte from before their start instead, which is then masked out
+        position_digits = digits[newline_indices - exponent - 1].astype(np.int64)
+        line_values += np.where(line_lengths > exponent, position_digits * 10 ** exponent, 0)
+    # Elves start on the first line and after every blank line, so a single reduceat() sums each elf's lines
+    is_elf_start = np.concatenate(([True], line_lengths[:-1] == 0))
+    return np.add.reduceat(line_values, np.flatnonzero(is_elf_start))
+
+
 def get_data(file_name='input.txt'):
-    with open(file_name) as f:
-        items_by_elf = (items_by_elf_str.split('\n') for items_by_elf_str in f.read().split('\n\n'))
-        items_by_elf = ([int(item) for item in items] for items in items_by_elf)
-        elves = [Elf(items) for items in items_by_elf]
-    return elves
+    return list(iter_elves(file_name))
+
+
+def get_top_total_calories(total_calories, top):
+    # A heap bounded to the top totals: O(top) memory and O(n log top) time, rather than sorting every elf
+    return heapq.nlargest(top, total_calories)
+
+
+def get_top_total_calories_array(total_calories, top):
+    # Partitioning finds the top totals in O(n), only they are then sorted
+    top = min(top, len(total_calories))
+    top_total_calories = np.partition(total_calories, len(total_calories) - top)[len(total_calories) - top:]
+    return sorted(top_total_calories.tolist(), reverse=True)
 
 
 def run(elves, top=1):
-    sorted_elves = sorted(elves, key=lambda elf: elf.total_calories, reverse=True)
-    top_elves = sorted_elves[:top]
+    # nlargest() calls the key once per elf, where sorting by total_calories would re-sum it on every comparison
+    top_elves = heapq.nlargest(top, elves, key=lambda elf: elf.total_calories)
     top_total_calories = sum((top_elf.total_calories for top_elf in top_elves))
     print(f'{top_total_calories} Calories')
 
 
+def print_top_total_calories(top_total_calories, top=1):
+    print(f'{sum(top_total_calories[:top])} Calories')
+
+
+class DaySolution(Solution):
+    streamed = True
+
+    def parse(self, file_name):
+        # Both parts are answered from the same top 3 totals, so only those are kept
+        # Large calorie dumps are parsed in bulk with NumPy, anything smaller is streamed elf by elf
+        if os.path.getsize(file_name) >= VECTORIZED_MIN_BYTES:
+            return get_top_total_calories_array(get_total_calories_array(file_name), top=3)
+        return get_top_total_calories(iter_total_calories(file_name), top=3)
+
+    def part_1(self, top_total_calories):
+        print_top_total_calories(top_total_calories)
+
+    def part_2(self, top_total_calories):
+        print_top_total_calories(top_total_calories, top=3)
+
+
 def main():
-    elves = get_data()
-    run(elves)
-    run(elves, top=3)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
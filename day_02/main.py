@@ -1,9 +1,19 @@
 # https://adventofcode.com/2022/day/2
 
+import os
 from dataclasses import dataclass
+from itertools import starmap
+from multiprocessing import Pool
 
+from common.solution import Solution
+from common.stream import get_line_aligned_ranges, iter_lines, read_range
 
-@dataclass
+CHUNK_BYTES = 16 * 1024 ** 2
+# Only files big enough to be split into several chunks are worth counting across processes
+PARALLEL_MIN_BYTES = 4 * CHUNK_BYTES
+
+
+@dataclass(slots=True)
 class Shape:
     SHAPE_LETTER_TO_SCORE_MAP = {'A': 1, 'B': 2, 'C': 3, 'X': 1, 'Y': 2, 'Z': 3}
 
@@ -15,7 +25,7 @@ class Shape:
 
 
 # Part 1 Round Class
-@dataclass
+@dataclass(slots=True)
 class Round:
     opponent_shape: Shape
     your_shape: Shape
@@ -34,7 +44,7 @@ class Round:
 
 
 # Part 2 Round Class
-@dataclass
+@dataclass(slots=True)
 class CookedRound:
     opponent_shape: Shape
     desired_outcome: str
@@ -53,27 +63,81 @@ class CookedRound:
                 return 3 + self.opponent_shape.score
 
 
+def iter_round_letters(file_name='input.txt'):
+    for round_str in iter_lines(file_name):
+        yield round_str.strip().split(' ')
+
+
+def make_round(letters, part=1):
+    match part:
+        case 1:
+            return Round(Shape(letters[0]), Shape(letters[1]))
+        case 2:
+            return CookedRound(Shape(letters[0]), letters[1])
+
+
+# There are only nine possible rounds, e.g. b'A Y', so their scores for both parts can be worked out up front
+ROUND_BYTES = [f'{opponent_letter} {second_letter}'.encode() for opponent_letter in 'ABC' for second_letter in 'XYZ']
+SCORE_TABLE = {round_bytes: (make_round(round_bytes.decode().split(' ')).score,
+                             make_round(round_bytes.decode().split(' '), part=2).score) for round_bytes in ROUND_BYTES}
+
+
+def iter_rounds(file_name='input.txt', part=1):
+    for letters in iter_round_letters(file_name):
+        yield make_round(letters, part)
+
+
 def get_data(file_name='input.txt', part=1):
-    with open(file_name) as f:
-        letters_by_round = (round_str.strip().split(' ') for round_str in f.readlines())
-        match part:
-            case 1:
-                rounds = [Round(Shape(letters[0]), Shape(letters[1])) for letters in letters_by_round]
-            case 2:
-                rounds = [CookedRound(Shape(letters[0]), letters[1]) for letters in letters_by_round]
-    return rounds
+    return list(iter_rounds(file_name, part))
+
+
+def count_rounds_in_range(file_name, start, end):
+    # A round can never match across a line break (e.g. b'X\nB'), so plain substring counts are exact
+    chunk = read_range(file_name, start, end)
+    return [chunk.count(round_bytes) for round_bytes in ROUND_BYTES]
+
+
+def count_rounds(file_name='input.txt', chunk_bytes=CHUNK_BYTES, processes=1):
+    # Example: {b'A X': 0, b'A Y': 12, ...}, how many times each of the nine possible rounds was played
+    range_args = [(file_name, start, end) for start, end in get_line_aligned_ranges(file_name, chunk_bytes)]
+    if processes == 1:
+        range_counts = list(starmap(count_rounds_in_range, range_args))
+    else:
+        with Pool(processes) as pool:
+            range_counts = pool.starmap(count_rounds_in_range, range_args)
+    return {round_bytes: sum(counts) for round_bytes, counts in zip(ROUND_BYTES, zip(*range_counts))}
+
+
+def run_counts(round_counts, part=1):
+    total_score = sum(count * SCORE_TABLE[round_bytes][part - 1] for round_bytes, count in round_counts.items())
+    print(f'Total Score: {total_score}')
 
 
 def run(rounds):
-    total_score = sum([round_.score for round_ in rounds])
+    total_score = sum(round_.score for round_ in rounds)
     print(f'Total Score: {total_score}')
 
 
+class DaySolution(Solution):
+    streamed = True
+
+    def parse(self, file_name):
+        # Both parts only need to know how often each round was played, whatever the second letter means
+        processes = self.processes if os.path.getsize(file_name) >= PARALLEL_MIN_BYTES else 1
+        return count_rounds(file_name, processes=processes)
+
+    def part_1(self, round_counts):
+        run_counts(round_counts)
+
+    def part_2(self, round_counts):
+        run_counts(round_counts, part=2)
+
+
 def main():
-    rounds = get_data()
-    run(rounds)
-    cooked_rounds = get_data(part=2)
-    run(cooked_rounds)
+    solution = DaySolution()
+    # Run on its own, the day is free to count a large input across every core
+    solution.processes = os.cpu_count()
+    solution.main()
 
 
 if __name__ == '__main__':
@@ -1,52 +1,76 @@
 # https://adventofcode.com/2022/day/3
 
+import string
 from dataclasses import dataclass
-from functools import reduce
 
-from numpy import intersect1d
+from common.solution import Solution
+from common.stream import iter_lines
 
+# Predetermined priorities: a-z are 1-26, A-Z are 27-52
+PRIORITIES = {item_letter: priority for priority, item_letter in
+              enumerate(string.ascii_lowercase + string.ascii_uppercase, start=1)}
+ITEM_BITS = {item_letter: 1 << priority for item_letter, priority in PRIORITIES.items()}
 
-@dataclass(frozen=True, order=True)
-class Item:
-    item_letter: str
 
-    @property
-    def priority(self):
-        # Predetermined ASCII offsets
-        if self.item_letter.isupper():
-            return ord(self.item_letter) - 38
-        return ord(self.item_letter) - 96
+def get_mask(item_letters):
+    # Example: 'aCa' -> 0b10...0010, with the bit of each item's priority set
+    return sum(map(ITEM_BITS.__getitem__, set(item_letters)))
+
+
+def get_priority(mask):
+    # Assumes there is one and only one item in the mask
+    return mask.bit_length() - 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Rucksack:
-    compartment_1: list[Item]
-    compartment_2: list[Item]
+    # Compartments are masks of the priorities of the items in them (see get_mask())
+    compartment_1: int
+    compartment_2: int
 
     @classmethod
-    def from_items(cls, items):
-        compartment_1 = items[:len(items) // 2]
-        compartment_2 = items[len(items) // 2:]
+    def from_items_str(cls, items_str):
+        compartment_1 = get_mask(items_str[:len(items_str) // 2])
+        compartment_2 = get_mask(items_str[len(items_str) // 2:])
         return cls(compartment_1, compartment_2)
 
     @property
     def all_items(self):
-        return self.compartment_1 + self.compartment_2
+        return self.compartment_1 | self.compartment_2
 
-    def get_common_item(self):
+    def get_common_priority(self):
         # Assumes there is one and only one common item
-        return intersect1d(self.compartment_1, self.compartment_2)[0]
+        return get_priority(self.compartment_1 & self.compartment_2)
+
+
+def iter_rucksacks(file_name='input.txt'):
+    for items_str in iter_lines(file_name):
+        yield Rucksack.from_items_str(items_str.strip())
 
 
 def get_data(file_name='input.txt'):
-    with open(file_name) as f:
-        items_by_rucksack = [[Item(item_letter) for item_letter in items_str.strip()] for items_str in f.readlines()]
-        rucksacks = [Rucksack.from_items(items) for items in items_by_rucksack]
-    return rucksacks
+    return list(iter_rucksacks(file_name))
+
+
+def get_total_priorities(file_name='input.txt', group_size=3):
+    # Batched: both parts are totalled in a single pass over the lines, without making a Rucksack for any of them
+    part_1_total_priority = 0
+    part_2_total_priority = 0
+    group_items = -1
+    for i, items_str in enumerate(iter_lines(file_name), start=1):
+        items_str = items_str.strip()
+        compartment_1 = get_mask(items_str[:len(items_str) // 2])
+        compartment_2 = get_mask(items_str[len(items_str) // 2:])
+        part_1_total_priority += get_priority(compartment_1 & compartment_2)
+        group_items &= compartment_1 | compartment_2
+        if i % group_size == 0:
+            part_2_total_priority += get_priority(group_items)
+            group_items = -1
+    return part_1_total_priority, part_2_total_priority
 
 
 def run_part_1(rucksacks):
-    total_priority = sum([rucksack.get_common_item().priority for rucksack in rucksacks])
+    total_priority = sum(rucksack.get_common_priority() for rucksack in rucksacks)
     print(f'Part 1 Total Priority: {total_priority}')
 
 
@@ -58,19 +82,31 @@ def run_part_2(rucksacks, group_size=3):
 
     total_priority = 0
     for rucksack_group in grouper(rucksacks, group_size):
-        # Get the items out of our rucksacks
-        rucksack_group_items = tuple(rucksack.all_items for rucksack in rucksack_group)
         # Assumes there is one and only one common item
-        common_item = reduce(intersect1d, rucksack_group_items)[0]
-        total_priority += common_item.priority
+        common_items = -1
+        for rucksack in rucksack_group:
+            common_items &= rucksack.all_items
+        total_priority += get_priority(common_items)
 
     print(f'Part 2 Total Priority: {total_priority}')
 
 
+class DaySolution(Solution):
+    streamed = True
+
+    def parse(self, file_name):
+        # Both totals come from a single pass over the rucksacks
+        return get_total_priorities(file_name)
+
+    def part_1(self, total_priorities):
+        print(f'Part 1 Total Priority: {total_priorities[0]}')
+
+    def part_2(self, total_priorities):
+        print(f'Part 2 Total Priority: {total_priorities[1]}')
+
+
 def main():
-    rucksacks = get_data()
-    run_part_1(rucksacks)
-    run_part_2(rucksacks)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,7 +1,22 @@
 # https://adventofcode.com/2022/day/4
 
+import os
 from dataclasses import dataclass
 
+from common.lazy import lazy_import
+from common.solution import Solution
+from common.stream import get_line_aligned_ranges, iter_lines, read_range
+from sections import SectionIndex
+
+# Only large inputs are processed with NumPy
+np = lazy_import('numpy')
+
+# Example: b'3-22,6-44' -> b'3 22 6 44'
+SEPARATOR_TABLE = bytes.maketrans(b'-,', b'  ')
+CHUNK_BYTES = 16 * 1024 ** 2
+# Below this, going team by team is quicker than importing NumPy
+VECTORIZED_MIN_BYTES = 1024 ** 2
+
 
 @dataclass
 class Assignment:
@@ -45,22 +60,82 @@ class Team:
         return a.is_overlapping_with(b) or b.is_overlapping_with(a)
 
 
+@dataclass
+class TeamColumns:
+    # Many teams at once, one array entry per team, e.g. '3-22,6-44' is a_start_ids[i] = 3, a_end_ids[i] = 22, ...
+    # Annotations are quoted so that defining the class does not import NumPy
+    a_start_ids: 'np.ndarray'
+    a_end_ids: 'np.ndarray'
+    b_start_ids: 'np.ndarray'
+    b_end_ids: 'np.ndarray'
+
+    @classmethod
+    def from_teams_bytes(cls, teams_bytes):
+        section_ids = np.fromstring(teams_bytes.translate(SEPARATOR_TABLE), dtype=np.int64, sep=' ')
+        return cls(*section_ids.reshape(-1, 4).T)
+
+    # Same interface as Team, except each check counts the matching teams rather than checking just the one
+    def check_fully_contained(self):
+        is_a_contained_in_b = (self.a_start_ids >= self.b_start_ids) & (self.a_end_ids <= self.b_end_ids)
+        is_b_contained_in_a = (self.b_start_ids >= self.a_start_ids) & (self.b_end_ids <= self.a_end_ids)
+        return int(np.count_nonzero(is_a_contained_in_b | is_b_contained_in_a))
+
+    def check_overlap(self):
+        # Two assignments overlap unless one of them ends before the other starts
+        return int(np.count_nonzero((self.a_start_ids <= self.b_end_ids) & (self.b_start_ids <= self.a_end_ids)))
+
+
+def iter_teams(file_name='input.txt'):
+    for team_str in iter_lines(file_name):
+        yield Team.from_team_str(team_str)
+
+
 def get_data(file_name='input.txt'):
-    with open(file_name) as f:
-        teams = [Team.from_team_str(team_str) for team_str in f.read().splitlines()]
-    return teams
+    return list(iter_teams(file_name))
+
+
+def get_section_index(file_name='input.txt'):
+    # Example: get_section_index().count_covering(5) is how many elves are assigned to section 5
+    return SectionIndex.from_teams(iter_teams(file_name))
+
+
+def get_team_columns(file_name='input.txt'):
+    with open(file_name, 'rb') as f:
+        return TeamColumns.from_teams_bytes(f.read())
+
+
+def iter_team_columns(file_name='input.txt', chunk_bytes=CHUNK_BYTES):
+    # Memory stays bounded by chunk_bytes, however many teams there are
+    for start, end in get_line_aligned_ranges(file_name, chunk_bytes):
+        yield TeamColumns.from_teams_bytes(read_range(file_name, start, end))
 
 
 def run(teams):
-    total_fully_contained = sum(team.check_fully_contained() for team in teams)
+    # Single pass, so teams can be streamed, either one Team or a chunk of TeamColumns at a time
+    total_fully_contained = 0
+    total_overlap = 0
+    for team in teams:
+        total_fully_contained += team.check_fully_contained()
+        total_overlap += team.check_overlap()
     print(f'Total Fully Contained: {total_fully_contained}')
-    total_overlap = sum(team.check_overlap() for team in teams)
     print(f'Total Overlapping: {total_overlap}')
 
 
+class DaySolution(Solution):
+    streamed = True
+
+    def parse(self, file_name):
+        # Both counts come from a single pass, so the teams are streamed straight into it
+        if os.path.getsize(file_name) >= VECTORIZED_MIN_BYTES:
+            return iter_team_columns(file_name)
+        return iter_teams(file_name)
+
+    def parts_1_2(self, teams):
+        run(teams)
+
+
 def main():
-    teams = get_data()
-    run(teams)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,63 @@
+import bisect
+import math
+from itertools import accumulate
+
+
+class SectionIndex:
+    # Indexes every elf's assignment (anything with start_id and end_id), so coverage questions about the whole input
+    # take O(log n) rather than a scan of every team
+
+    def __init__(self, assignments):
+        self.assignments = sorted(assignments, key=lambda assignment: (assignment.start_id, assignment.end_id))
+        self.start_ids = [assignment.start_id for assignment in self.assignments]
+        self.sorted_end_ids = sorted(assignment.end_id for assignment in self.assignments)
+        # Segment tree over self.assignments holding the furthest end_id below each node, so searches for overlapping
+        # assignments can skip whole spans that end too early
+        self.leaf_count = 1 << max(len(self.assignments) - 1, 0).bit_length()
+        self.max_end_ids = [-math.inf] * (2 * self.leaf_count)
+        for i, assignment in enumerate(self.assignments):
+            self.max_end_ids[self.leaf_count + i] = assignment.end_id
+        for node in reversed(range(1, self.leaf_count)):
+            self.max_end_ids[node] = max(self.max_end_ids[2 * node], self.max_end_ids[2 * node + 1])
+
+    @classmethod
+    def from_teams(cls, teams):
+        return cls(assignment for team in teams for assignment in (team.assignment_a, team.assignment_b))
+
+    def count_covering(self, section_id):
+        # Assignments starting at or before the section, minus those that also ended before it
+        return bisect.bisect_right(self.start_ids, section_id) - bisect.bisect_left(self.sorted_end_ids, section_id)
+
+    def count_overlapping(self, start_id, end_id):
+        # Assignments starting at or before the range ends, minus those that ended before the range starts
+        return bisect.bisect_right(self.start_ids, end_id) - bisect.bisect_left(self.sorted_end_ids, start_id)
+
+    def find_overlapping(self, start_id, end_id):
+        # O(log n) per assignment found, returned in order of start_id
+        candidate_count = bisect.bisect_right(self.start_ids, end_id)
+        overlapping = []
+        nodes = [(1, 0, self.leaf_count)]
+        while nodes:
+            node, lower, upper = nodes.pop()
+            # Skip spans that start after the range ends, or that all end before it starts
+            if lower >= candidate_count or self.max_end_ids[node] < start_id:
+                continue
+            if upper - lower == 1:
+                overlapping.append(self.assignments[lower])
+                continue
+            middle = (lower + upper) // 2
+            nodes.append((2 * node + 1, middle, upper))
+            nodes.append((2 * node, lower, middle))
+        return overlapping
+
+    def get_coverage(self):
+        # Example: {1: 1, 2: 2, 3: 1}, how many elves are assigned to each section, from a sweep over the sections
+        if not self.assignments:
+            return {}
+        first_id = self.start_ids[0]
+        last_id = self.sorted_end_ids[-1]
+        coverage_changes = [0] * (last_id - first_id + 2)
+        for assignment in self.assignments:
+            coverage_changes[assignment.start_id - first_id] += 1
+            coverage_changes[assignment.end_id - first_id + 1] -= 1
+        return dict(zip(range(first_id, last_id + 1), accumulate(coverage_changes[:-1])))
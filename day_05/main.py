@@ -1,8 +1,16 @@
 # https://adventofcode.com/2022/day/5
 
 import re
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from common.solution import Solution
+
+PROCEDURE_PATTERN = re.compile(r'move (?P<quantity>\d+) from (?P<source_id>\d+) to (?P<target_id>\d+)')
+# How each crane model lands the crates it lifts onto a stack, e.g. the 9000 moves them one at a time, reversing them
+CRANE_MODELS = {
+    9000: lambda stack_crates, crates: stack_crates.extend(reversed(crates)),
+    9001: list.extend,
+}
 
 
 @dataclass
@@ -25,13 +33,18 @@ class Procedure:
 
     @classmethod
     def from_procedure_str(cls, procedure_str):
-        m = re.match(r'move (?P<quantity>\d+) from (?P<source_id>\d+) to (?P<target_id>\d+)', procedure_str)
+        m = PROCEDURE_PATTERN.match(procedure_str)
         return cls(*map(int, m.groups()))
 
 
 @dataclass
 class Ship:
     stacks: list[Stack]
+    stacks_by_id: dict[int, Stack] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Avoiding reliance on the implementation detail that the stacks happen to be in order
+        self.stacks_by_id = {stack.stack_id: stack for stack in self.stacks}
 
     @classmethod
     def from_deck_layout_str(cls, deck_layout_str):
@@ -47,23 +60,12 @@ class Ship:
         top_crates = [stack.crates[-1] for stack in self.stacks]
         return ''.join(top_crates)
 
-    def get_stack(self, stack_id):
-        # Avoiding reliance on the implementation detail that the stacks happen to be in order
-        return next(stack for stack in self.stacks if stack.stack_id == stack_id)
-
-    def operate_crane(self, procedure, crane_model):
-        source_stack = self.get_stack(procedure.source_id)
-        target_stack = self.get_stack(procedure.target_id)
+    def copy(self):
+        # Operating the crane rearranges the crates, so each crane model operates on its own copy of the stacks
+        return Ship([Stack(stack.stack_id, stack.crates.copy()) for stack in self.stacks])
 
-        match crane_model:
-            case 9000:
-                for _ in range(procedure.quantity):
-                    crate = source_stack.crates.pop()
-                    target_stack.crates.append(crate)
-            case 9001:
-                crates = source_stack.crates[-procedure.quantity:]
-                source_stack.crates = source_stack.crates[:-procedure.quantity]
-                target_stack.crates += crates
+    def get_stack(self, stack_id):
+        return self.stacks_by_id[stack_id]
 
 
 def get_data(file_name='input.txt'):
@@ -75,15 +77,51 @@ def get_data(file_name='input.txt'):
 
 
 def run(ship, procedures, crane_model=9000):
+    top_crate_codes = run_crane_models(ship, procedures, crane_models=(crane_model,))
+    print(f'Message: {top_crate_codes[crane_model]}')
+
+
+def run_crane_models(ship, procedures, crane_models=tuple(CRANE_MODELS)):
+    # Replays the procedures once for every crane model, each operating on its own copy of the stacks
+    # Example: {9000: 'CMZ', 9001: 'MCD'}
+    ships = {crane_model: ship.copy() for crane_model in crane_models}
+    # Example: [({1: ['Z', 'N'], ...}, CRANE_MODELS[9000]), ...], each crane model's stacks and how it lands crates
+    states = []
+    for crane_model, crane_ship in ships.items():
+        crates_by_id = {stack_id: stack.crates for stack_id, stack in crane_ship.stacks_by_id.items()}
+        states.append((crates_by_id, CRANE_MODELS[crane_model]))
     for procedure in procedures:
-        ship.operate_crane(procedure, crane_model)
-    print(f'Message: {ship.top_crate_code}')
+        quantity, source_id, target_id = procedure.quantity, procedure.source_id, procedure.target_id
+        for crates_by_id, land_crates in states:
+            # Only the moved crates are copied, the rest of the source stack stays where it is
+            source_crates = crates_by_id[source_id]
+            split_index = len(source_crates) - quantity
+            crates = source_crates[split_index:]
+            del source_crates[split_index:]
+            land_crates(crates_by_id[target_id], crates)
+    return {crane_model: crane_ship.top_crate_code for crane_model, crane_ship in ships.items()}
+
+
+class DaySolution(Solution):
+    # Both parts are solved in precompute(), so there is no telling its time apart from theirs
+    streamed = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def precompute(self, data):
+        # Both parts replay the same procedures, so they are replayed just once for both crane models
+        return run_crane_models(*data)
+
+    def part_1(self, top_crate_codes):
+        print(f'Message: {top_crate_codes[9000]}')
+
+    def part_2(self, top_crate_codes):
+        print(f'Message: {top_crate_codes[9001]}')
 
 
 def main():
-    ship, procedures = get_data()
-    run(deepcopy(ship), procedures)
-    run(deepcopy(ship), procedures, crane_model=9001)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,17 +1,89 @@
 # https://adventofcode.com/2022/day/6
 
-from more_itertools import windowed
+import math
+import os
+from itertools import chain
+from multiprocessing import Pool
+
+from common.solution import Solution
+
+CHUNK_BYTES = 64 * 1024
 
 
 class Device:
     @staticmethod
-    def is_marker_valid(marker):
-        return len(marker) == len(set(marker))
+    def find_markers(datastream, marker_lengths=(4, 14)):
+        # Example: {4: 7, 14: 19}, how many characters are processed before each marker is complete
+        # A single O(n) scan finds every marker length, by tracking where the current run of distinct characters starts
+        # from the last position each character was seen at
+        marker_positions = {}
+        remaining_marker_lengths = sorted(set(marker_lengths))
+        last_seen_positions = {}
+        run_start = 0
+        for i, character in enumerate(datastream if remaining_marker_lengths else ''):
+            run_start = max(run_start, last_seen_positions.get(character, -1) + 1)
+            last_seen_positions[character] = i
+            # The run grows by at most one character at a time, so markers complete in order of length
+            if i + 1 - run_start == remaining_marker_lengths[0]:
+                marker_positions[remaining_marker_lengths.pop(0)] = i + 1
+                if not remaining_marker_lengths:
+                    break
+        return marker_positions
+
+    def subroutine(self, datastream, marker_length=4, processes=1):
+        # The datastream can also be anything with read(), e.g. an open file or an mmap, which is then read in chunks
+        # Positions carry on from one chunk to the next, so markers straddling two chunks are still found
+        # With processes > 1, an open file is split into ranges searched across that many processes instead (anything
+        # else, e.g. an mmap, has no file for the workers to read their ranges from, so is still searched here)
+        if processes > 1 and hasattr(datastream, 'name'):
+            return find_markers_in_file(datastream.name, (marker_length,), processes).get(marker_length)
+        if hasattr(datastream, 'read'):
+            datastream = chain.from_iterable(iter_chunks(datastream))
+        return self.find_markers(datastream, (marker_length,)).get(marker_length)
+
+
+def iter_chunks(stream, chunk_bytes=CHUNK_BYTES, max_bytes=None):
+    # Reads at most max_bytes (default: the rest of the stream)
+    remaining_bytes = math.inf if max_bytes is None else max_bytes
+    while remaining_bytes > 0 and (chunk := stream.read(min(chunk_bytes, remaining_bytes))):
+        remaining_bytes -= len(chunk)
+        yield chunk
+
+
+def iter_datastream(file_name='input.txt', chunk_bytes=CHUNK_BYTES, start=0, end=None):
+    # Only one chunk of the datastream (or of its range from start to end) is ever held in memory
+    with open(file_name, 'rb') as f:
+        f.seek(start)
+        for chunk in iter_chunks(f, chunk_bytes, None if end is None else end - start):
+            yield from chunk
+
 
-    def subroutine(self, datastream, marker_length=4):
-        for i, marker in enumerate(windowed(datastream, marker_length)):
-            if self.is_marker_valid(marker):
-                return i + marker_length
+def find_markers_in_range(file_name, start, end, marker_lengths):
+    # Starts scanning early enough to see the whole of any marker that completes within the range
+    overlap_start = max(0, start - (max(marker_lengths) - 1))
+    marker_positions = Device.find_markers(iter_datastream(file_name, start=overlap_start, end=end), marker_lengths)
+    return {marker_length: overlap_start + position for marker_length, position in marker_positions.items()}
+
+
+def find_markers_in_file(file_name='input.txt', marker_lengths=(4, 14), processes=1):
+    # Example: {4: 7, 14: 19}, like Device.find_markers(), without ever reading the whole datastream into memory
+    file_bytes = os.path.getsize(file_name)
+    if processes == 1:
+        return Device.find_markers(iter_datastream(file_name), marker_lengths)
+
+    # Every worker scans its own range of the datastream (plus the overlap before it) to the end, so this only pays off
+    # when the markers are far in, and the earliest marker any worker finds wins
+    range_bytes = max(1, math.ceil(file_bytes / processes))
+    range_args = [(file_name, start, min(start + range_bytes, file_bytes), marker_lengths) for start in
+                  range(0, file_bytes, range_bytes)]
+    with Pool(processes) as pool:
+        range_marker_positions = pool.starmap(find_markers_in_range, range_args)
+    marker_positions = {}
+    for marker_length in marker_lengths:
+        positions = [positions[marker_length] for positions in range_marker_positions if marker_length in positions]
+        if positions:
+            marker_positions[marker_length] = min(positions)
+    return marker_positions
 
 
 def get_data(file_name='input.txt'):
@@ -20,14 +92,24 @@ def get_data(file_name='input.txt'):
 
 
 def run(device, datastream):
-    print(f'Packet Character: {device.subroutine(datastream)}')
-    print(f'Message Character: {device.subroutine(datastream, marker_length=14)}')
+    marker_positions = device.find_markers(datastream, marker_lengths=(4, 14))
+    print(f'Packet Character: {marker_positions.get(4)}')
+    print(f'Message Character: {marker_positions.get(14)}')
+
+
+class DaySolution(Solution):
+    streamed = True
+
+    def parse(self, file_name):
+        # Both markers are found in a single pass, so the datastream is streamed straight into it
+        return iter_datastream(file_name)
+
+    def parts_1_2(self, datastream):
+        run(Device(), datastream)
 
 
 def main():
-    device = Device()
-    datastream = get_data()
-    run(device, datastream)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,7 +1,12 @@
 # https://adventofcode.com/2022/day/7
 
+from array import array
 from dataclasses import dataclass, field
 
+from common.solution import Solution
+from common.stream import iter_lines
+from sizes import SizeIndex
+
 
 class File:
     def __init__(self, name, size):
@@ -14,21 +19,32 @@ class Directory(File):
     name: str
     parent: 'Directory' = None
     contents: list[File] = field(default_factory=list)
-
-    @property
-    def size(self):
-        return sum(item.size for item in self.contents)
+    # Kept up to date as items are added anywhere below this directory, so reading it is O(1)
+    size: int = 0
+    # The subdirectories in contents, by name
+    directories: dict[str, 'Directory'] = field(default_factory=dict, repr=False)
+
+    def add(self, item):
+        self.contents.append(item)
+        if isinstance(item, Directory):
+            # Like a linear scan of contents would, keep finding the first directory of that name
+            self.directories.setdefault(item.name, item)
+        # The new item's size counts towards every directory up to the root
+        directory = self
+        while directory is not None:
+            directory.size += item.size
+            directory = directory.parent
 
     def get_directory(self, directory_name):
-        for item in self.contents:
-            if isinstance(item, Directory) and item.name == directory_name:
-                return item
+        return self.directories.get(directory_name)
 
     def get_directories(self):
-        for item in self.contents:
-            if isinstance(item, Directory):
-                yield item
-                yield from item.get_directories()
+        # Depth first, without recursing, so even very deep trees stay within the recursion limit
+        directories = list(reversed(self.directories.values()))
+        while directories:
+            directory = directories.pop()
+            yield directory
+            directories.extend(reversed(directory.directories.values()))
 
 
 class FileSystem:
@@ -36,6 +52,8 @@ class FileSystem:
         self.total_space = total_space
         self.root_directory = Directory('/')
         self.current_directory = None
+        # See build_size_index()
+        self.size_index = None
 
     @property
     def free_space(self):
@@ -44,6 +62,13 @@ class FileSystem:
     def get_all_directories(self):
         return self.root_directory.get_directories()
 
+    def get_directory_sizes(self):
+        return (directory.size for directory in self.get_all_directories())
+
+    def build_size_index(self):
+        # Only once the whole log has been parsed, as later lines would change the sizes
+        self.size_index = SizeIndex(self.get_directory_sizes())
+
     def parse_cd(self, directory_name):
         match directory_name:
             case '/':
@@ -72,37 +97,122 @@ class FileSystem:
             case 'dir':
                 directory_name = other[0]
                 new_directory = Directory(directory_name, parent=self.current_directory)
-                self.current_directory.contents.append(new_directory)
+                self.current_directory.add(new_directory)
             case _:
                 file_name = other[0]
                 file_size = int(identifier)
                 new_file = File(file_name, file_size)
-                self.current_directory.contents.append(new_file)
+                self.current_directory.add(new_file)
+
+
+class CompactFileSystem:
+    # The same file system without an object per file and directory, for terminal logs describing millions of files
+    # Directories are rows of parallel arrays (the root being row 0), and files only add to their directories' sizes
+    ROOT_INDEX = 0
+
+    def __init__(self, total_space):
+        self.total_space = total_space
+        self.parent_indices = array('q', [-1])
+        self.sizes = array('q', [0])
+        # Directory i is named names[name_offsets[i]:name_offsets[i + 1]]
+        self.names = bytearray(b'/')
+        self.name_offsets = array('q', [0, 1])
+        # Example: {(0, 'a'): 1}, the row of each directory by its parent's row and its name
+        self.child_indices = {}
+        self.current_index = None
+        # See build_size_index()
+        self.size_index = None
+
+    @property
+    def free_space(self):
+        return self.total_space - self.sizes[self.ROOT_INDEX]
+
+    def get_name(self, index):
+        return self.names[self.name_offsets[index]:self.name_offsets[index + 1]].decode()
+
+    def get_directory_sizes(self):
+        # Like FileSystem.get_all_directories(), every directory except the root
+        return self.sizes[self.ROOT_INDEX + 1:]
+
+    def build_size_index(self):
+        # Only once the whole log has been parsed, as later lines would change the sizes
+        self.size_index = SizeIndex(self.get_directory_sizes())
+
+    def add_directory(self, directory_name):
+        if (self.current_index, directory_name) in self.child_indices:
+            return
+        self.child_indices[self.current_index, directory_name] = len(self.sizes)
+        self.parent_indices.append(self.current_index)
+        self.sizes.append(0)
+        self.names += directory_name.encode()
+        self.name_offsets.append(len(self.names))
+
+    def add_file(self, file_size):
+        # The file's size counts towards every directory up to the root
+        index = self.current_index
+        while index != -1:
+            self.sizes[index] += file_size
+            index = self.parent_indices[index]
+
+    def parse_cd(self, directory_name):
+        match directory_name:
+            case '/':
+                self.current_index = self.ROOT_INDEX
+            case '..':
+                self.current_index = self.parent_indices[self.current_index]
+            case _:
+                self.current_index = self.child_indices[self.current_index, directory_name]
+
+    def parse_line(self, line):
+        identifier, *other = line.split(' ')
+        match identifier:
+            case '$':
+                # Skip ls command
+                if other[0] == 'cd':
+                    self.parse_cd(other[1])
+            case 'dir':
+                self.add_directory(other[0])
+            case _:
+                self.add_file(int(identifier))
 
 
-def get_data(total_space, file_name='input.txt'):
-    file_system = FileSystem(total_space)
-    with open(file_name) as f:
-        for line in f.read().splitlines():
-            file_system.parse_line(line)
+def get_data(total_space, file_name='input.txt', compact=False):
+    file_system = CompactFileSystem(total_space) if compact else FileSystem(total_space)
+    for line in iter_lines(file_name):
+        file_system.parse_line(line)
     return file_system
 
 
 def run_part_1(file_system, at_most_size):
-    total_size = sum(directory.size for directory in file_system.get_all_directories() if directory.size <= at_most_size)
+    total_size = file_system.size_index.sum_at_most(at_most_size)
     print(f'Part 1 Total Size: {total_size}')
 
 
 def run_part_2(file_system, update_size):
     required_space = update_size - file_system.free_space
-    total_size = min(directory.size for directory in file_system.get_all_directories() if directory.size >= required_space)
+    total_size = file_system.size_index.find_smallest_at_least(required_space)
     print(f'Part 2 Total Size: {total_size}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        # Only the directory sizes are needed, which the compact file system has in a fraction of the time and memory
+        return get_data(total_space=70000000, file_name=file_name, compact=True)
+
+    def precompute(self, file_system):
+        # Both parts search the same size index
+        file_system.build_size_index()
+        return file_system
+
+    def part_1(self, file_system):
+        run_part_1(file_system, at_most_size=100000)
+
+    def part_2(self, file_system):
+        run_part_2(file_system, update_size=30000000)
+
+
 def main():
-    file_system = get_data(total_space=70000000)
-    run_part_1(file_system, at_most_size=100000)
-    run_part_2(file_system, update_size=30000000)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,25 @@
+import bisect
+from itertools import accumulate
+
+
+class SizeIndex:
+    # Indexes directory sizes, so threshold questions about every directory take O(log n) rather than a full scan
+
+    def __init__(self, sizes):
+        self.sizes = sorted(sizes)
+        # Example: [0, 3, 10, 20], total_sizes[i] is the sum of the i smallest sizes
+        self.total_sizes = list(accumulate(self.sizes, initial=0))
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def count_at_most(self, size):
+        return bisect.bisect_right(self.sizes, size)
+
+    def sum_at_most(self, size):
+        return self.total_sizes[self.count_at_most(size)]
+
+    def find_smallest_at_least(self, size):
+        # None when every size is below the threshold
+        i = bisect.bisect_left(self.sizes, size)
+        return self.sizes[i] if i < len(self.sizes) else None
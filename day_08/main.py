@@ -1,20 +1,25 @@
 # https://adventofcode.com/2022/day/8
 
-import operator
-from dataclasses import dataclass, field
-from functools import reduce
+import os
+from dataclasses import dataclass
 from itertools import product, chain
 
+from common.lazy import lazy_import
+from common.solution import Solution
 
-@dataclass
+# Only large forests are processed with NumPy
+np = lazy_import('numpy')
+
+# Below this, a Tree per cell is quicker than importing NumPy
+VECTORIZED_MIN_BYTES = 1024 ** 2
+
+
+@dataclass(slots=True)
 class Tree:
     height: int
     is_visible: bool = False
-    scenic_scores: list[int] = field(default_factory=list)
-
-    @property
-    def scenic_score(self):
-        return reduce(operator.mul, self.scenic_scores, 1)
+    # The product of the viewing distances from each side, kept as a running product rather than a list per tree
+    scenic_score: int = 1
 
 
 @dataclass
@@ -50,18 +55,87 @@ class Forest:
                 tree.is_visible = True
                 max_height = tree.height
 
+    @staticmethod
+    def get_viewing_distances(heights):
+        # Example: [3, 0, 3, 7, 3] -> [2, 1, 1, 1, 0], how many trees each tree sees behind it (towards the end)
+        # Walks the line backwards with a stack of the indices that may still block a view, their heights only ever
+        # increasing towards the bottom: a tree hides every shorter tree behind it, so those are popped for good
+        viewing_distances = [0] * len(heights)
+        blocking_indices = []
+        for i in reversed(range(len(heights))):
+            height = heights[i]
+            while blocking_indices and heights[blocking_indices[-1]] < height:
+                blocking_indices.pop()
+            # Without a blocking tree, the view reaches the edge
+            viewing_distances[i] = (blocking_indices[-1] if blocking_indices else len(heights) - 1) - i
+            blocking_indices.append(i)
+        return viewing_distances
+
     def _update_tree_scenic_scores(self):
         # Assumes it is only called once during init
         # Also must convert to using lists over generators since we need to double dip into tree_line
         for tree_line in map(list, self.get_tree_lines_from_all_sides()):
-            for i, tree in enumerate(tree_line):
-                scenic_score = 0
-                # Look at the other trees behind this tree
-                for other_tree in tree_line[i + 1:]:
-                    scenic_score += 1
-                    if other_tree.height >= tree.height:
-                        break
-                tree.scenic_scores.append(scenic_score)
+            viewing_distances = self.get_viewing_distances([tree.height for tree in tree_line])
+            for tree, viewing_distance in zip(tree_line, viewing_distances):
+                tree.scenic_score *= viewing_distance
+
+    def count_visible(self):
+        return sum(int(tree.is_visible) for tree in chain.from_iterable(self.trees))
+
+    def get_max_scenic_score(self):
+        return max(tree.scenic_score for tree in chain.from_iterable(self.trees))
+
+
+@dataclass
+class ForestArray:
+    # The same forest as one array entry per tree rather than a Tree each, e.g. heights[row, column]
+    # Annotations are quoted so that defining the class does not import NumPy
+    heights: 'np.ndarray'
+    is_visible: 'np.ndarray'
+    scenic_scores: 'np.ndarray'
+
+    @classmethod
+    def from_height_map_bytes(cls, height_map_bytes):
+        height_rows = height_map_bytes.split()
+        heights = np.frombuffer(b''.join(height_rows), dtype=np.uint8).reshape(len(height_rows), -1) - ord('0')
+        forest = cls(heights, np.zeros(heights.shape, dtype=bool), np.ones(heights.shape, dtype=np.int64))
+        # Each side is a view of the arrays, with its tree lines along the rows, so results are written in place
+        for transpose, reverse in product((False, True), repeat=2):
+            side_slice = (slice(None), slice(None, None, -1) if reverse else slice(None))
+            arrays = (heights, forest.is_visible, forest.scenic_scores)
+            side_arrays = (array.T if transpose else array for array in arrays)
+            heights_view, is_visible_view, scenic_scores_view = (array[side_slice] for array in side_arrays)
+            is_visible_view |= cls.get_visibilities(heights_view)
+            scenic_scores_view *= cls.get_viewing_distances(heights_view)
+        return forest
+
+    @staticmethod
+    def get_visibilities(heights):
+        # A tree is visible when it is taller than every tree before it in its line, the first one always being visible
+        is_visible = np.ones(heights.shape, dtype=bool)
+        is_visible[:, 1:] = heights[:, 1:] > np.maximum.accumulate(heights, axis=1)[:, :-1]
+        return is_visible
+
+    @staticmethod
+    def get_viewing_distances(heights):
+        # Same as Forest.get_viewing_distances() for every line at once, one height at a time
+        line_length = heights.shape[1]
+        indices = np.arange(line_length, dtype=np.int32)
+        viewing_distances = np.zeros(heights.shape, dtype=np.int32)
+        for height in np.flatnonzero(np.bincount(heights.ravel())):
+            # Behind each tree (but for the last one, whose view is 0), the index of the first tree at least this tall,
+            # or of the edge if there is none: a running minimum from the end of the line
+            blocking_indices = np.where(heights[:, 1:] >= height, indices[1:], np.int32(line_length - 1))
+            blocking_indices = np.minimum.accumulate(blocking_indices[:, ::-1], axis=1)[:, ::-1]
+            np.copyto(viewing_distances[:, :-1], blocking_indices - indices[:-1], where=heights[:, :-1] == height)
+        return viewing_distances
+
+    # Same interface as Forest
+    def count_visible(self):
+        return int(np.count_nonzero(self.is_visible))
+
+    def get_max_scenic_score(self):
+        return int(self.scenic_scores.max())
 
 
 def get_data(file_name='input.txt'):
@@ -70,16 +144,31 @@ def get_data(file_name='input.txt'):
     return forest
 
 
+def get_forest_array(file_name='input.txt'):
+    with open(file_name, 'rb') as f:
+        return ForestArray.from_height_map_bytes(f.read())
+
+
 def run(forest):
-    total_visible = sum(int(tree.is_visible) for tree in chain.from_iterable(forest.trees))
+    # Either a Forest or a ForestArray
+    total_visible = forest.count_visible()
     print(f'Total Visible: {total_visible}')
-    max_scenic_score = max(tree.scenic_score for tree in chain.from_iterable(forest.trees))
+    max_scenic_score = forest.get_max_scenic_score()
     print(f'Max Scenic Score: {max_scenic_score}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        if os.path.getsize(file_name) >= VECTORIZED_MIN_BYTES:
+            return get_forest_array(file_name)
+        return get_data(file_name)
+
+    def parts_1_2(self, forest):
+        run(forest)
+
+
 def main():
-    forest = get_data()
-    run(forest)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -4,8 +4,12 @@ import numpy as np
 from dataclasses import dataclass, field
 from more_itertools import windowed
 
+from common.instrument import instrumented
+from common.solution import Solution
+from common.stream import iter_lines
 
-@dataclass
+
+@dataclass(slots=True)
 class Movement:
     DIRECTIONS_MAP = {'L': np.array([-1, 0]), 'R': np.array([1, 0]), 'U': np.array([0, 1]), 'D': np.array([0, -1])}
     direction: np.array
@@ -17,7 +21,7 @@ class Movement:
         return cls(cls.DIRECTIONS_MAP[direction_str], int(steps_str))
 
 
-@dataclass
+@dataclass(slots=True)
 class Knot:
     pos: np.array = field(default_factory=lambda: np.zeros(2))
 
@@ -52,6 +56,7 @@ class Rope:
         # Example: If leading knot is at (2,1) and tailing knot is at (0,0), stabilising direction = (1,1)
         return np.fromiter(map(np.sign, leading_knot.pos - tailing_knot.pos), dtype=int)
 
+    @instrumented
     def move(self, direction):
         self.head.move(direction)
         for leading_knot, tailing_knot in windowed(self.knots, n=2, step=1):
@@ -66,10 +71,12 @@ class Rope:
         self.tail_pos_log.add(tuple(self.tail.pos))
 
 
+def iter_movements(file_name='input.txt'):
+    return map(Movement.from_movement_str, iter_lines(file_name))
+
+
 def get_data(file_name='input.txt'):
-    with open(file_name) as f:
-        movements = list(map(Movement.from_movement_str, f.read().splitlines()))
-    return movements
+    return list(iter_movements(file_name))
 
 
 def run(rope, movements):
@@ -79,10 +86,19 @@ def run(rope, movements):
     print(f'Positions Visited: {len(rope.tail_pos_log)}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, movements):
+        run(Rope(), movements)
+
+    def part_2(self, movements):
+        run(Rope(length=10), movements)
+
+
 def main():
-    movements = get_data()
-    run(Rope(), movements)
-    run(Rope(length=10), movements)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
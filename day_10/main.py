@@ -2,6 +2,9 @@
 
 from dataclasses import dataclass
 
+from common.solution import Solution
+from common.stream import iter_lines
+
 
 @dataclass
 class Process:
@@ -20,10 +23,12 @@ class Process:
 
 
 class Device:
-    register_x: int = 1
-    queue: list = []
-    signal_strength_log: list = []
-    crt_display: list[list[chr]] = [['▯' for _ in range(40)] for _ in range(6)]
+    def __init__(self):
+        # Per instance, so that several devices (e.g. one per input in a batch) never share their state
+        self.register_x: int = 1
+        self.queue: list = []
+        self.signal_strength_log: list = []
+        self.crt_display: list[list[chr]] = [['▯' for _ in range(40)] for _ in range(6)]
 
     @property
     def current_process(self):
@@ -44,6 +49,8 @@ class Device:
             self.crt_display[position[1]][position[0]] = '▮'
 
     def execute(self, instructions, max_cycles=240):
+        # Instructions are only read as they are needed, so they can be streamed
+        instructions = iter(instructions)
         for cycle in range(1, max_cycles + 1):
             # End of previous cycle, execute the current process if no work is remaining
             if self.current_process and self.current_process.work_remaining == 0:
@@ -51,7 +58,7 @@ class Device:
 
             # Start of this cycle, enqueue process from next instruction if the queue is empty
             if not self.current_process:
-                new_process = Process.from_instruction(instructions.pop(0))
+                new_process = Process.from_instruction(next(instructions))
                 self.queue.append(new_process)
 
             # During this cycle, do work on the current process and update the CRT
@@ -69,8 +76,7 @@ class Device:
 
 
 def get_data(file_name='input.txt'):
-    with open(file_name) as f:
-        return f.read().splitlines()
+    return iter_lines(file_name)
 
 
 def run(device, instructions):
@@ -79,10 +85,19 @@ def run(device, instructions):
     device.draw()
 
 
+class DaySolution(Solution):
+    streamed = True
+
+    def parse(self, file_name):
+        # The device executes the instructions in a single pass, so they are streamed straight into it
+        return get_data(file_name)
+
+    def parts_1_2(self, instructions):
+        run(Device(), instructions)
+
+
 def main():
-    device = Device()
-    instructions = get_data()
-    run(device, instructions)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,11 +1,11 @@
 # https://adventofcode.com/2022/day/11
 
 import math
-import numpy as np
 import operator
 import re
-from dataclasses import dataclass
-from functools import reduce
+from dataclasses import dataclass, replace
+
+from common.solution import Solution
 
 SUPPORTED_OPS = {
     '+': operator.add,
@@ -69,6 +69,10 @@ class Monkey:
         test = Test(int(m['test_value']), int(m['test_true_monkey_id']), int(m['test_false_monkey_id']))
         return cls(monkey_id, items, operation, test)
 
+    def copy(self):
+        # Monkeys pass their items around, so each part plays with its own copy of them
+        return replace(self, items=[Item(item.worry_level) for item in self.items])
+
     def inspect(self, item, worry_reduction_mod):
         self.inspections += 1
         item.worry_level = self.operation.apply_to(item.worry_level)
@@ -106,14 +110,22 @@ def run(monkeys, rounds=20, worry_reduction_mod=None, top=2):
     print(f'Monkey Business: {monkey_business}')
 
 
+class DaySolution(Solution):
+    cached = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, monkeys):
+        run([monkey.copy() for monkey in monkeys])
+
+    def part_2(self, monkeys):
+        worry_reduction_mod = math.lcm(*(monkey.test.value for monkey in monkeys))
+        run([monkey.copy() for monkey in monkeys], rounds=10000, worry_reduction_mod=worry_reduction_mod)
+
+
 def main():
-    # Part 1
-    monkeys = get_data()
-    run(monkeys)
-    # Part 2
-    monkeys = get_data()
-    worry_reduction_mod = reduce(np.lcm, (monkey.test.value for monkey in monkeys))
-    run(monkeys, rounds=10000, worry_reduction_mod=worry_reduction_mod)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,9 +1,13 @@
 # https://adventofcode.com/2022/day/12
 
-import networkx as nx
 import numpy as np
 from more_itertools import windowed
 
+from common.lazy import lazy_import
+from common.solution import Solution
+
+nx = lazy_import('networkx')
+
 SPECIAL_ELEVATIONS = {'S': 'a', 'E': 'z'}
 
 
@@ -65,10 +69,21 @@ def run_part_2(graph):
     print(f'Part 2 Path Length: {min(path_lengths)}')
 
 
+class DaySolution(Solution):
+    cached = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, graph):
+        run_part_1(graph)
+
+    def part_2(self, graph):
+        run_part_2(graph)
+
+
 def main():
-    graph = get_data()
-    run_part_1(graph)
-    run_part_2(graph)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -6,12 +6,16 @@ from dataclasses import dataclass
 from more_itertools import windowed
 from itertools import zip_longest
 
+from common.instrument import instrumented
+from common.solution import Solution
+
 
 @dataclass
 class Packet:
     items: list
     is_divider: bool = False
 
+    @instrumented
     def compare(self, left, right):
         # Example: 2 vs 4
         if isinstance(left, int) and isinstance(right, int):
@@ -61,12 +65,22 @@ def run_part_2(packets):
     print(f'Decoder Key: {math.prod(divider_indices)}')
 
 
+class DaySolution(Solution):
+    cached = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, packets):
+        run_part_1(packets)
+
+    def part_2(self, packets):
+        # Add divider packets for part 2
+        run_part_2(packets + [Packet([[2]], is_divider=True), Packet([[6]], is_divider=True)])
+
+
 def main():
-    packets = get_data()
-    run_part_1(packets)
-    # Add divider packets for part 2
-    packets += [Packet([[2]], is_divider=True), Packet([[6]], is_divider=True)]
-    run_part_2(packets)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -4,6 +4,9 @@ import numpy as np
 from dataclasses import dataclass, field
 from more_itertools import windowed
 
+from common.instrument import instrumented
+from common.solution import Solution
+
 
 @dataclass
 class Sand:
@@ -77,6 +80,10 @@ class Cave:
     def __post_init__(self):
         self.floor_level = max((y for x, y in self.objects_at_rest)) + 2
 
+    def copy(self, floor_exists=None):
+        # Simulating fills the cave with sand, so each part simulates its own copy of the rocks
+        return Cave(self.objects_at_rest.copy(), self.floor_exists if floor_exists is None else floor_exists)
+
     def is_floor_level(self, position):
         return position[1] == self.floor_level
 
@@ -85,6 +92,7 @@ class Cave:
         collision_with_cave_floor = self.floor_exists and self.is_floor_level(position)
         return collision_with_object_at_rest or collision_with_cave_floor
 
+    @instrumented
     def simulate(self):
         sand = self.sand_spawner.spawn()
         # Treat floor level as the abyss line
@@ -110,11 +118,19 @@ def run(cave):
     print(f'Total Sand: {cave.sand_at_rest_total}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, cave):
+        run(cave.copy())
+
+    def part_2(self, cave):
+        run(cave.copy(floor_exists=True))
+
+
 def main():
-    cave = get_data()
-    run(cave)
-    cave = get_data(floor_exists=True)
-    run(cave)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
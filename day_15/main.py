@@ -5,6 +5,13 @@ import portion as p
 import re
 from dataclasses import dataclass, field
 
+from common.solution import Solution
+
+READOUT_PATTERN = re.compile(
+    r'Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): '
+    r'closest beacon is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)'
+)
+
 
 @dataclass
 class Sensor:
@@ -14,11 +21,7 @@ class Sensor:
 
     @classmethod
     def from_readout_str(cls, readout_str):
-        readout_pattern = re.compile(
-            r'Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): '
-            r'closest beacon is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)'
-        )
-        m = readout_pattern.match(readout_str)
+        m = READOUT_PATTERN.match(readout_str)
         sensor_position = np.array((m['sensor_x'], m['sensor_y']), dtype=int)
         beacon_position = np.array((m['beacon_x'], m['beacon_y']), dtype=int)
         return cls(sensor_position, beacon_position)
@@ -69,10 +72,21 @@ def run_part_2(sensors, x_bounds, y_bounds):
             break
 
 
+class DaySolution(Solution):
+    cached = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, sensors):
+        run_part_1(sensors, y=2000000)
+
+    def part_2(self, sensors):
+        run_part_2(sensors, x_bounds=p.closed(0, 4000000), y_bounds=p.closed(0, 4000000))
+
+
 def main():
-    sensors = get_data()
-    run_part_1(sensors, y=2000000)
-    run_part_2(sensors, x_bounds=p.closed(0, 4000000), y_bounds=p.closed(0, 4000000))
+    DaySolution().main()
 
 
 if __name__ == '__main__':
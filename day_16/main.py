@@ -6,6 +6,14 @@ from dataclasses import dataclass
 from more_itertools import set_partitions
 from time import time
 
+from common.instrument import instrumented
+from common.solution import Solution
+
+READOUT_PATTERN = re.compile(
+    r'Valve (?P<name>\w+) has flow rate=(?P<flow_rate>\d+); '
+    r'tunnel[s]* lead[s]* to valve[s]* (?P<linked_valve_names>.+)'
+)
+
 
 @dataclass
 class Valve:
@@ -15,11 +23,7 @@ class Valve:
 
     @classmethod
     def from_readout_str(cls, readout_str):
-        readout_pattern = re.compile(
-            r'Valve (?P<name>\w+) has flow rate=(?P<flow_rate>\d+); '
-            r'tunnel[s]* lead[s]* to valve[s]* (?P<linked_valve_names>.+)'
-        )
-        m = readout_pattern.match(readout_str)
+        m = READOUT_PATTERN.match(readout_str)
         return cls(m['name'], int(m['flow_rate']), m['linked_valve_names'].split(', '))
 
     def __hash__(self):
@@ -43,6 +47,7 @@ class TunnelNetwork(nx.Graph):
     def get_valve(self, name):
         return next(valve for valve in self.nodes if valve.name == name)
 
+    @instrumented
     def traverse(self, current_valve, remaining_valves, remaining_minutes):
         # Remove the current valve from the remaining valves
         remaining_valves = [valve for valve in remaining_valves if valve.name != current_valve.name]
@@ -88,10 +93,21 @@ def run(tunnel_network, remaining_minutes, worker_count=1):
     print(f'Calculated in {time() - start_time:.2f} seconds')
 
 
+class DaySolution(Solution):
+    cached = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, tunnel_network):
+        run(tunnel_network, remaining_minutes=30)
+
+    def part_2(self, tunnel_network):
+        run(tunnel_network, remaining_minutes=26, worker_count=2)
+
+
 def main():
-    tunnel_network = get_data()
-    run(tunnel_network, remaining_minutes=30)
-    run(tunnel_network, remaining_minutes=26, worker_count=2)
+    tunnel_network = DaySolution().main()
     # For fun, assuming we can train both elephants at the same time
     run(tunnel_network, remaining_minutes=26, worker_count=3)
 
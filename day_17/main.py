@@ -3,6 +3,8 @@
 import numpy as np
 from dataclasses import dataclass, field
 
+from common.instrument import instrumented
+from common.solution import Solution
 from shapes import HLine, Plus, L, VLine, Square
 
 
@@ -48,6 +50,7 @@ class RockColumn:
                 return True
         return False
 
+    @instrumented
     def simulate(self, total):
         jet_directions_iter = self.get_jet_directions_iter()
         for falling_shape in self.spawn_shapes(total):
@@ -72,11 +75,19 @@ def run(rock_column, rocks_total):
     print(f'Total Height: {rock_column.total_height}')
 
 
-def main():
-    rock_column = get_data()
-    run(rock_column, rocks_total=2022)
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, rock_column):
+        run(rock_column, rocks_total=2022)
+
     # Part 2: Just determined the formula by inspection, not interesting enough to justify ruining the code for
 
 
+def main():
+    DaySolution().main()
+
+
 if __name__ == '__main__':
     main()
@@ -1,6 +1,13 @@
 import numpy as np
 from dataclasses import dataclass, field
 
+# Shared by every shape spawned, these are never modified
+H_LINE_ROCK_POSITIONS = list(map(np.array, [(0, 0), (1, 0), (2, 0), (3, 0)]))
+PLUS_ROCK_POSITIONS = list(map(np.array, [(1, 0), (0, 1), (1, 1), (2, 1), (1, 2)]))
+L_ROCK_POSITIONS = list(map(np.array, [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]))
+V_LINE_ROCK_POSITIONS = list(map(np.array, [(0, 0), (0, 1), (0, 2), (0, 3)]))
+SQUARE_ROCK_POSITIONS = list(map(np.array, [(0, 0), (1, 0), (0, 1), (1, 1)]))
+
 
 @dataclass
 class Shape:
@@ -14,29 +21,24 @@ class Shape:
 
 @dataclass
 class HLine(Shape):
-    local_rock_positions: list[np.array] = field(
-        default_factory=lambda: list(map(np.array, [(0, 0), (1, 0), (2, 0), (3, 0)])))
+    local_rock_positions: list[np.array] = field(default_factory=lambda: H_LINE_ROCK_POSITIONS)
 
 
 @dataclass
 class Plus(Shape):
-    local_rock_positions: list[np.array] = field(
-        default_factory=lambda: list(map(np.array, [(1, 0), (0, 1), (1, 1), (2, 1), (1, 2)])))
+    local_rock_positions: list[np.array] = field(default_factory=lambda: PLUS_ROCK_POSITIONS)
 
 
 @dataclass
 class L(Shape):
-    local_rock_positions: list[np.array] = field(
-        default_factory=lambda: list(map(np.array, [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)])))
+    local_rock_positions: list[np.array] = field(default_factory=lambda: L_ROCK_POSITIONS)
 
 
 @dataclass
 class VLine(Shape):
-    local_rock_positions: list[np.array] = field(
-        default_factory=lambda: list(map(np.array, [(0, 0), (0, 1), (0, 2), (0, 3)])))
+    local_rock_positions: list[np.array] = field(default_factory=lambda: V_LINE_ROCK_POSITIONS)
 
 
 @dataclass
 class Square(Shape):
-    local_rock_positions: list[np.array] = field(
-        default_factory=lambda: list(map(np.array, [(0, 0), (1, 0), (0, 1), (1, 1)])))
+    local_rock_positions: list[np.array] = field(default_factory=lambda: SQUARE_ROCK_POSITIONS)
@@ -1,18 +1,25 @@
 # https://adventofcode.com/2022/day/18
 
-import networkx as nx
 import numpy as np
 
+from common.lazy import lazy_import
+from common.solution import Solution
+from common.stream import iter_lines
 from structures import Cube
 
+nx = lazy_import('networkx')
+
+
+def iter_cubes(file_name='input.txt'):
+    for position_str in iter_lines(file_name):
+        yield Cube(np.array(position_str.split(','), dtype=int))
+
 
 def get_data(file_name='input.txt'):
-    with open(file_name) as f:
-        cubes = [Cube(np.array(position_str.split(','), dtype=int)) for position_str in f.read().splitlines()]
-    return cubes
+    return list(iter_cubes(file_name))
 
 
-def run_part_1(cubes):
+def get_exposed_sides(cubes):
     exposed_sides = set()
     for cube in cubes:
         for side in cube.sides:
@@ -20,10 +27,13 @@ def run_part_1(cubes):
                 exposed_sides.remove(side)
             else:
                 exposed_sides.add(side)
-    print(f'Exposed Sides: {len(exposed_sides)}')
     return exposed_sides
 
 
+def run_part_1(exposed_sides):
+    print(f'Exposed Sides: {len(exposed_sides)}')
+
+
 def run_part_2(exposed_sides):
     graph = nx.Graph()
     exposed_positions = [tuple(side.position) for side in exposed_sides]
@@ -34,10 +44,23 @@ def run_part_2(exposed_sides):
     print(f'Exterior Sides: {len(largest_connected_component)}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def precompute(self, cubes):
+        # Both parts only need the exposed sides
+        return get_exposed_sides(cubes)
+
+    def part_1(self, exposed_sides):
+        run_part_1(exposed_sides)
+
+    def part_2(self, exposed_sides):
+        run_part_2(exposed_sides)
+
+
 def main():
-    cubes = get_data()
-    exposed_sides = run_part_1(cubes)
-    run_part_2(exposed_sides)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 ALL_OFFSETS = list(map(np.array, [(-0.5, 0, 0), (0.5, 0, 0), (0, -0.5, 0), (0, 0.5, 0), (0, 0, -0.5), (0, 0, 0.5)]))
 
 
-@dataclass
+@dataclass(slots=True)
 class Cube:
     position: np.array
 
@@ -18,7 +18,7 @@ class Cube:
         return (Side.from_cube(self, side_offset) for side_offset in self.get_side_offsets())
 
 
-@dataclass
+@dataclass(slots=True)
 class Side:
     position: np.array
     direction_from_cube: np.array = field(default_factory=lambda: np.array((0, 0)))
@@ -66,7 +66,7 @@ class Side:
         return hash(tuple(self.position))
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     position: np.array
     direction_from_cube: np.array
@@ -4,6 +4,9 @@ import re
 from copy import deepcopy
 from dataclasses import dataclass
 
+from common.instrument import instrumented
+from common.solution import Solution
+
 BLUEPRINT_PATTERN = re.compile(
     r'Blueprint (?P<id>\d+):'
     r' Each ore robot costs (?P<ore_robot_ore_cost>\d+) ore.'
@@ -88,6 +91,7 @@ def get_data(file_name='input.txt'):
     return robot_factories
 
 
+@instrumented
 def simulate(robot_factory: RobotFactory, old_state: State):
     geode_totals = []
     for robot_type_to_build in robot_factory.get_build_list(old_state):
@@ -126,10 +130,21 @@ def run(robot_factories, total_minutes, top=None):
     print(f'Total Quality: {total_quality}')
 
 
+class DaySolution(Solution):
+    cached = True
+
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, robot_factories):
+        run(robot_factories, total_minutes=24)
+
+    def part_2(self, robot_factories):
+        run(robot_factories, total_minutes=32, top=3)
+
+
 def main():
-    robot_factories = get_data()
-    run(robot_factories, total_minutes=24)
-    run(robot_factories, total_minutes=32, top=3)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
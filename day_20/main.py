@@ -2,16 +2,27 @@
 
 from dataclasses import dataclass
 
+from common.solution import Solution
+from common.stream import iter_lines
 
-@dataclass
+
+@dataclass(slots=True)
 class Item:
     id: int
     value: int
 
 
+def iter_items(file_name='input.txt', decryption_key=1):
+    for i, number_str in enumerate(iter_lines(file_name)):
+        yield Item(i, int(number_str) * decryption_key)
+
+
 def get_data(file_name='input.txt', decryption_key=1):
-    with open(file_name) as f:
-        return [Item(i, int(number_str) * decryption_key) for i, number_str in enumerate(f.read().splitlines())]
+    return list(iter_items(file_name, decryption_key))
+
+
+def decrypt(items, decryption_key):
+    return [Item(item.id, item.value * decryption_key) for item in items]
 
 
 def run(items, mix_count=1):
@@ -28,11 +39,19 @@ def run(items, mix_count=1):
     print(f'Grove Total: {grove_total}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, items):
+        run(items)
+
+    def part_2(self, items):
+        run(decrypt(items, decryption_key=811589153), mix_count=10)
+
+
 def main():
-    items = get_data()
-    run(items)
-    items = get_data(decryption_key=811589153)
-    run(items, mix_count=10)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
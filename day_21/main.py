@@ -1,11 +1,15 @@
 # https://adventofcode.com/2022/day/21
 
 import operator
-import sympy
 from dataclasses import dataclass
 
+from common.lazy import lazy_import
+from common.solution import Solution
 from monkey import Monkey, DumbMonkey, CleverMonkey, Human
 
+# Only part 2 needs sympy, and it is by far the slowest import
+sympy = lazy_import('sympy')
+
 
 @dataclass
 class Troop:
@@ -39,8 +43,8 @@ def run_part_1(troop, root_monkey_name='root'):
 
 
 def run_part_2(troop, root_monkey_name='root', human_name='humn'):
-    # Change Monkey 'humn' into a Human
-    troop.monkeys[human_name] = Human(human_name)
+    # Change Monkey 'humn' into a Human, in a troop of our own so part 1 can still be run on the original
+    troop = Troop({**troop.monkeys, human_name: Human(human_name)})
 
     # Find out what the Left Monkey and Right Monkey from the Root Monkey yell
     root_monkey = troop.monkeys[root_monkey_name]
@@ -52,10 +56,19 @@ def run_part_2(troop, root_monkey_name='root', human_name='humn'):
     print(f'Human Yelled: {human_yelled:.0f}')
 
 
+class DaySolution(Solution):
+    def parse(self, file_name):
+        return get_data(file_name)
+
+    def part_1(self, troop):
+        run_part_1(troop)
+
+    def part_2(self, troop):
+        run_part_2(troop)
+
+
 def main():
-    troop = get_data()
-    run_part_1(troop)
-    run_part_2(troop)
+    DaySolution().main()
 
 
 if __name__ == '__main__':
@@ -1,7 +1,10 @@
 import operator
 from dataclasses import dataclass
 
-from sympy import Symbol
+from common.instrument import instrumented
+from common.lazy import lazy_import
+
+sympy = lazy_import('sympy')
 
 
 @dataclass
@@ -26,6 +29,7 @@ class CleverMonkey(Monkey):
     right_monkey_name: str
     operand: operator
 
+    @instrumented
     def yell(self, troop):
         left_monkey = troop.monkeys[self.left_monkey_name]
         right_monkey = troop.monkeys[self.right_monkey_name]
@@ -35,4 +39,4 @@ class CleverMonkey(Monkey):
 @dataclass
 class Human(Monkey):
     def yell(self, troop):
-        return Symbol(self.name)
+        return sympy.Symbol(self.name)
@@ -0,0 +1,58 @@
+# Solves a single day against many puzzle inputs at once, printing each result as a JSON line as soon as it completes
+# Usage (from the repository root): python -m runner.batch day_11 inputs/day_11/ 'more_inputs/*.txt' [--workers 4]
+
+import argparse
+import glob
+import json
+import os
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+from common.days import load_day
+from runner.main import run_day
+
+worker_day_name = None
+
+
+def init_worker(day_name):
+    # Import the day once per worker, so module level precomputation (e.g. compiled patterns, shape tables) is shared
+    # by every input that worker solves
+    global worker_day_name
+    worker_day_name = day_name
+    load_day(day_name)
+
+
+def solve_input(file_name):
+    start_time = time.perf_counter()
+    _, report = run_day(worker_day_name, file_name)
+    return {'input': file_name, 'wall_seconds': time.perf_counter() - start_time, **report}
+
+
+def get_file_names(paths):
+    # Example: 'inputs/' expands to every file in it, 'inputs/*.txt' to every file it matches
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(str(file_path) for file_path in Path(path).iterdir() if file_path.is_file())
+        else:
+            yield from sorted(glob.glob(path))
+
+
+def run(day_name, file_names, workers=None):
+    with Pool(processes=workers, initializer=init_worker, initargs=(day_name,)) as pool:
+        yield from pool.imap_unordered(solve_input, file_names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Solve one day for many puzzle inputs, streaming JSON lines')
+    parser.add_argument('day_name', help='e.g. day_11')
+    parser.add_argument('paths', nargs='+', help='input directories or glob patterns')
+    parser.add_argument('--workers', type=int, help='maximum inputs solved at once (default: the number of cores)')
+    args = parser.parse_args()
+
+    for result in run(args.day_name, get_file_names(args.paths), workers=args.workers):
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == '__main__':
+    main()
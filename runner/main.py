@@ -0,0 +1,102 @@
+# Runs every day's solution in a process pool and reports parse vs. solve timings alongside each answer as JSON
+# Usage (from the repository root):
+#     python -m runner.main [day_01 day_16 ...] [--output report.json] [--history report.json]
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from common import instrument
+from common.days import ROOT_PATH, get_day_names, load_solution
+from common.solution import STREAMED_PHASE_NAME, Stopwatch
+
+# Without a previous report to go on, these are known to take the longest
+KNOWN_SLOW_DAY_NAMES = ['day_19', 'day_16', 'day_15']
+
+
+def run_day(day_name, file_name):
+    report = {}
+    try:
+        solution = load_solution(day_name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = solution.prepare(file_name)
+        answers = {}
+        for part_name, part in solution.parts.items():
+            # Parts print their answers, so whatever they print is the answer
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                solution.time_phase(part_name, part, data)
+            answers[part_name] = output.getvalue().strip()
+        # Example: parse and precompute, or only parse_and_solve when streamed, in which case parts have no timings
+        phase_stopwatches = solution.get_phase_stopwatches()
+        for phase_name, stopwatch in phase_stopwatches.items():
+            if phase_name not in answers:
+                report[phase_name] = stopwatch.to_dict()
+        report['parts'] = {}
+        for part_name, answer in answers.items():
+            part_stopwatch = phase_stopwatches.get(part_name)
+            report['parts'][part_name] = {**(part_stopwatch.to_dict() if part_stopwatch else {}), 'answer': answer}
+    except Exception:
+        report['error'] = traceback.format_exc()
+    if instrument.ENABLED:
+        report['instrumentation'] = instrument.pop_stats()
+    return day_name, report
+
+
+def get_total_wall_seconds(day_report):
+    phase_names = ('parse', 'precompute', STREAMED_PHASE_NAME)
+    return sum(day_report.get(phase_name, {}).get('wall_seconds', 0) for phase_name in phase_names) + sum(
+        part_report.get('wall_seconds', 0) for part_report in day_report.get('parts', {}).values())
+
+
+def get_expected_durations(day_names, history_file_name):
+    if history_file_name and os.path.exists(history_file_name):
+        with open(history_file_name) as f:
+            history = json.load(f)['days']
+        return {day_name: get_total_wall_seconds(history[day_name]) if day_name in history else 0 for day_name in
+                day_names}
+    return {day_name: len(KNOWN_SLOW_DAY_NAMES) - KNOWN_SLOW_DAY_NAMES.index(day_name) if
+            day_name in KNOWN_SLOW_DAY_NAMES else 0 for day_name in day_names}
+
+
+def run(day_names, history_file_name=None, max_workers=None):
+    # Start the longest jobs first, so they are not left running on their own at the end
+    expected_durations = get_expected_durations(day_names, history_file_name)
+    day_names = sorted(day_names, key=lambda day_name: expected_durations[day_name], reverse=True)
+
+    day_reports = {}
+    with Stopwatch() as stopwatch, ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for day_name in day_names:
+            file_name = ROOT_PATH / day_name / 'input.txt'
+            if not file_name.exists():
+                day_reports[day_name] = {'error': f'Missing input: {file_name}'}
+                continue
+            futures.append(executor.submit(run_day, day_name, str(file_name)))
+        for future in as_completed(futures):
+            day_name, day_report = future.result()
+            day_reports[day_name] = day_report
+    return {'wall_seconds': stopwatch.wall_seconds, 'days': dict(sorted(day_reports.items()))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every day's solution in parallel and report timings as JSON")
+    parser.add_argument('day_names', nargs='*', default=get_day_names(), help='e.g. day_01 (default: all days)')
+    parser.add_argument('--workers', type=int, help='defaults to the number of cores')
+    parser.add_argument('--output', help='write the report to this file instead of printing it')
+    parser.add_argument('--history', help='a previous report, used to start the longest days first')
+    args = parser.parse_args()
+
+    report = run(args.day_names, history_file_name=args.history, max_workers=args.workers)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()